@@ -3,18 +3,70 @@ Context extractor for AutoGraph.
 Extracts business context of AI agent usage.
 """
 
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, Pattern
 from ..utils.logger import get_logger
 from ..llm_integration.llm_client import LLMClient
 
 logger = get_logger(__name__)
 
 
+def _keyword_pattern(*keywords: str) -> Pattern[str]:
+    """Compile a case-insensitive substring alternation for the given keywords."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+# Precompiled keyword patterns for rule-based context extraction
+_PURPOSE_CLASSIFY_RE = _keyword_pattern('classify', 'categorize', 'sort')
+_PURPOSE_RECOMMEND_RE = _keyword_pattern('recommend', 'suggest', 'recommendation')
+_PURPOSE_ANALYZE_RE = _keyword_pattern('analyze', 'analysis', 'insight')
+_PURPOSE_PREDICT_RE = _keyword_pattern('predict', 'forecast', 'prediction')
+_PURPOSE_GENERATE_RE = _keyword_pattern('generate', 'create', 'produce')
+_PURPOSE_TRANSLATE_RE = _keyword_pattern('translate', 'language', 'text')
+_IMPACT_CUSTOMER_RE = _keyword_pattern('customer', 'user', 'client')
+_IMPACT_REVENUE_RE = _keyword_pattern('revenue', 'sales', 'profit')
+_IMPACT_SECURITY_RE = _keyword_pattern('security', 'compliance', 'legal')
+_IMPACT_OPERATION_RE = _keyword_pattern('operation', 'process', 'workflow')
+_DATA_CUSTOMER_RE = _keyword_pattern('customer', 'user', 'personal')
+_DATA_FINANCIAL_RE = _keyword_pattern('financial', 'payment', 'transaction')
+_DATA_TEXT_RE = _keyword_pattern('text', 'document', 'content')
+_DATA_IMAGE_RE = _keyword_pattern('image', 'photo', 'visual')
+_DATA_LOG_RE = _keyword_pattern('log', 'event', 'activity')
+_DECISION_APPROVE_RE = _keyword_pattern('approve', 'reject', 'decision')
+_DECISION_CLASSIFY_RE = _keyword_pattern('classify', 'categorize', 'label')
+_DECISION_RECOMMEND_RE = _keyword_pattern('recommend', 'suggest', 'advise')
+_DECISION_ROUTE_RE = _keyword_pattern('route', 'direct', 'assign')
+_STAKEHOLDER_CUSTOMER_RE = _keyword_pattern('customer', 'user', 'client')
+_STAKEHOLDER_EMPLOYEE_RE = _keyword_pattern('employee', 'staff', 'team')
+_STAKEHOLDER_MANAGER_RE = _keyword_pattern('manager', 'executive', 'leadership')
+_STAKEHOLDER_REGULATOR_RE = _keyword_pattern('regulator', 'compliance', 'auditor')
+_COMPLIANCE_GDPR_RE = _keyword_pattern('gdpr', 'privacy', 'personal')
+_COMPLIANCE_HIPAA_RE = _keyword_pattern('hipaa', 'health', 'medical')
+_COMPLIANCE_SOX_RE = _keyword_pattern('sox', 'financial', 'audit')
+_COMPLIANCE_PCI_RE = _keyword_pattern('pci', 'payment', 'card')
+
+# Files shorter than this are handled by rule-based extraction only
+_MIN_LLM_CONTENT_LENGTH = 200
+
+# Shared LLM client, created on first use so extractors stay cheap to construct
+_LLM_CLIENT_SINGLETON: Optional[LLMClient] = None
+
+
+def _get_llm_client() -> LLMClient:
+    """Get the shared LLM client, creating it on first call."""
+    global _LLM_CLIENT_SINGLETON
+    if _LLM_CLIENT_SINGLETON is None:
+        _LLM_CLIENT_SINGLETON = LLMClient()
+    return _LLM_CLIENT_SINGLETON
+
+
 class ContextExtractor:
     """Extracts business context of AI agent usage."""
     
-    def __init__(self):
-        self.llm_client = LLMClient()
+    @property
+    def llm_client(self) -> LLMClient:
+        """LLM client shared across all extractors."""
+        return _get_llm_client()
     
     def extract_business_context(self, file_content: str, file_path: str, 
                                 agent_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -24,40 +76,39 @@ class ContextExtractor:
         # Extract basic context without LLM
         basic_context = self._extract_basic_context(file_content, agent_info)
         
+        # Skip the LLM for files without agent usage or too small to add insight
+        if not agent_info.get('has_agent') or len(file_content) < _MIN_LLM_CONTENT_LENGTH:
+            return {**basic_context, 'extraction_method': 'rule_based'}
+        
         # Try to get enhanced context from LLM
         enhanced_context = self._extract_enhanced_context(file_content, file_path, agent_info)
         
         return {
-            'business_purpose': enhanced_context.get('business_purpose', basic_context['business_purpose']),
-            'business_impact': enhanced_context.get('business_impact', basic_context['business_impact']),
-            'data_processed': enhanced_context.get('data_processed', basic_context['data_processed']),
-            'decisions_made': enhanced_context.get('decisions_made', basic_context['decisions_made']),
-            'stakeholders': enhanced_context.get('stakeholders', basic_context['stakeholders']),
-            'compliance_implications': enhanced_context.get('compliance_implications', basic_context['compliance_implications']),
+            **basic_context,
+            **enhanced_context,
             'extraction_method': enhanced_context.get('extraction_method', 'rule_based')
         }
     
     def _extract_basic_context(self, file_content: str, agent_info: Dict[str, Any]) -> Dict[str, Any]:
         """Extract basic business context using rule-based analysis."""
-        content_lower = file_content.lower()
-        
+        # Keyword patterns are case-insensitive, so the content is scanned as-is
         # Identify business purpose based on keywords
-        business_purpose = self._identify_business_purpose(content_lower)
+        business_purpose = self._identify_business_purpose(file_content)
         
         # Identify business impact
-        business_impact = self._identify_business_impact(content_lower)
+        business_impact = self._identify_business_impact(file_content)
         
         # Identify data being processed
-        data_processed = self._identify_data_processed(content_lower)
+        data_processed = self._identify_data_processed(file_content)
         
         # Identify decisions being made
-        decisions_made = self._identify_decisions_made(content_lower)
+        decisions_made = self._identify_decisions_made(file_content)
         
         # Identify stakeholders
-        stakeholders = self._identify_stakeholders(content_lower)
+        stakeholders = self._identify_stakeholders(file_content)
         
         # Identify compliance implications
-        compliance_implications = self._identify_compliance_implications(content_lower)
+        compliance_implications = self._identify_compliance_implications(file_content)
         
         return {
             'business_purpose': business_purpose,
@@ -122,30 +173,30 @@ class ContextExtractor:
         """Identify business purpose based on keywords."""
         purposes = []
         
-        if any(word in content for word in ['classify', 'categorize', 'sort']):
+        if _PURPOSE_CLASSIFY_RE.search(content):
             purposes.append('Classification')
-        if any(word in content for word in ['recommend', 'suggest', 'recommendation']):
+        if _PURPOSE_RECOMMEND_RE.search(content):
             purposes.append('Recommendation')
-        if any(word in content for word in ['analyze', 'analysis', 'insight']):
+        if _PURPOSE_ANALYZE_RE.search(content):
             purposes.append('Analysis')
-        if any(word in content for word in ['predict', 'forecast', 'prediction']):
+        if _PURPOSE_PREDICT_RE.search(content):
             purposes.append('Prediction')
-        if any(word in content for word in ['generate', 'create', 'produce']):
+        if _PURPOSE_GENERATE_RE.search(content):
             purposes.append('Content Generation')
-        if any(word in content for word in ['translate', 'language', 'text']):
+        if _PURPOSE_TRANSLATE_RE.search(content):
             purposes.append('Language Processing')
         
         return ', '.join(purposes) if purposes else 'AI-powered processing'
     
     def _identify_business_impact(self, content: str) -> str:
         """Identify business impact of AI failure."""
-        if any(word in content for word in ['customer', 'user', 'client']):
+        if _IMPACT_CUSTOMER_RE.search(content):
             return 'Customer experience and satisfaction'
-        if any(word in content for word in ['revenue', 'sales', 'profit']):
+        if _IMPACT_REVENUE_RE.search(content):
             return 'Revenue and financial performance'
-        if any(word in content for word in ['security', 'compliance', 'legal']):
+        if _IMPACT_SECURITY_RE.search(content):
             return 'Security and compliance risks'
-        if any(word in content for word in ['operation', 'process', 'workflow']):
+        if _IMPACT_OPERATION_RE.search(content):
             return 'Operational efficiency'
         
         return 'General business operations'
@@ -154,15 +205,15 @@ class ContextExtractor:
         """Identify data being processed."""
         data_types = []
         
-        if any(word in content for word in ['customer', 'user', 'personal']):
+        if _DATA_CUSTOMER_RE.search(content):
             data_types.append('Customer data')
-        if any(word in content for word in ['financial', 'payment', 'transaction']):
+        if _DATA_FINANCIAL_RE.search(content):
             data_types.append('Financial data')
-        if any(word in content for word in ['text', 'document', 'content']):
+        if _DATA_TEXT_RE.search(content):
             data_types.append('Text content')
-        if any(word in content for word in ['image', 'photo', 'visual']):
+        if _DATA_IMAGE_RE.search(content):
             data_types.append('Image data')
-        if any(word in content for word in ['log', 'event', 'activity']):
+        if _DATA_LOG_RE.search(content):
             data_types.append('Log data')
         
         return ', '.join(data_types) if data_types else 'General data'
@@ -171,13 +222,13 @@ class ContextExtractor:
         """Identify decisions being made by AI."""
         decisions = []
         
-        if any(word in content for word in ['approve', 'reject', 'decision']):
+        if _DECISION_APPROVE_RE.search(content):
             decisions.append('Approval/Rejection decisions')
-        if any(word in content for word in ['classify', 'categorize', 'label']):
+        if _DECISION_CLASSIFY_RE.search(content):
             decisions.append('Classification decisions')
-        if any(word in content for word in ['recommend', 'suggest', 'advise']):
+        if _DECISION_RECOMMEND_RE.search(content):
             decisions.append('Recommendation decisions')
-        if any(word in content for word in ['route', 'direct', 'assign']):
+        if _DECISION_ROUTE_RE.search(content):
             decisions.append('Routing decisions')
         
         return ', '.join(decisions) if decisions else 'AI-powered decisions'
@@ -186,13 +237,13 @@ class ContextExtractor:
         """Identify stakeholders affected by AI."""
         stakeholders = []
         
-        if any(word in content for word in ['customer', 'user', 'client']):
+        if _STAKEHOLDER_CUSTOMER_RE.search(content):
             stakeholders.append('Customers')
-        if any(word in content for word in ['employee', 'staff', 'team']):
+        if _STAKEHOLDER_EMPLOYEE_RE.search(content):
             stakeholders.append('Employees')
-        if any(word in content for word in ['manager', 'executive', 'leadership']):
+        if _STAKEHOLDER_MANAGER_RE.search(content):
             stakeholders.append('Management')
-        if any(word in content for word in ['regulator', 'compliance', 'auditor']):
+        if _STAKEHOLDER_REGULATOR_RE.search(content):
             stakeholders.append('Regulators')
         
         return ', '.join(stakeholders) if stakeholders else 'Business stakeholders'
@@ -201,13 +252,13 @@ class ContextExtractor:
         """Identify compliance implications."""
         implications = []
         
-        if any(word in content for word in ['gdpr', 'privacy', 'personal']):
+        if _COMPLIANCE_GDPR_RE.search(content):
             implications.append('GDPR/Privacy compliance')
-        if any(word in content for word in ['hipaa', 'health', 'medical']):
+        if _COMPLIANCE_HIPAA_RE.search(content):
             implications.append('HIPAA compliance')
-        if any(word in content for word in ['sox', 'financial', 'audit']):
+        if _COMPLIANCE_SOX_RE.search(content):
             implications.append('SOX compliance')
-        if any(word in content for word in ['pci', 'payment', 'card']):
+        if _COMPLIANCE_PCI_RE.search(content):
             implications.append('PCI compliance')
         
         return ', '.join(implications) if implications else 'General compliance requirements' 
\ No newline at end of file
@@ -3,18 +3,17 @@ Risk assessor for AutoGraph.
 Assesses business risk of AI agent components.
 """
 
-from typing import Dict, List, Any, Optional
-from enum import Enum
+import re
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class RiskLevel(Enum):
-    """Risk levels for agent components."""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
+# Risk levels for agent components
+RISK_LOW = "low"
+RISK_MEDIUM = "medium"
+RISK_HIGH = "high"
 
 
 class RiskAssessor:
@@ -77,32 +76,48 @@ class RiskAssessor:
                 'complex', 'sophisticated'
             ]
         }
+        
+        # Reverse index so a single scan maps each keyword hit straight to its
+        # factors (a keyword such as 'password' can belong to more than one)
+        self._kw_to_factors: Dict[str, Tuple[str, ...]] = {}
+        for factor, keywords in self.high_risk_keywords.items():
+            for keyword in keywords:
+                self._kw_to_factors[keyword] = self._kw_to_factors.get(keyword, ()) + (factor,)
+        
+        # Zero-width lookahead so every offset is tested and overlapping keywords
+        # are all reported. Matched case-sensitively against lower-cased content,
+        # like the original substring checks; IGNORECASE would also match
+        # look-alikes such as 'ſ' for 's' that are not keys of the index.
+        self._keyword_re = re.compile(
+            '(?=(' + '|'.join(re.escape(kw) for kw in self._kw_to_factors) + '))'
+        )
     
     def assess_risk(self, file_content: str, file_path: str, agent_info: Dict[str, Any]) -> Dict[str, Any]:
         """Assess the business risk of an agent component."""
         logger.debug(f"Assessing risk for: {file_path}")
         
+        # Identify risk factors
+        risk_factors = self._identify_risk_factors(file_content)
+        
         # Calculate risk score
-        risk_score = self._calculate_risk_score(file_content, agent_info)
+        risk_score = self._calculate_risk_score(file_content, agent_info, risk_factors)
         
         # Determine risk level
         risk_level = self._determine_risk_level(risk_score)
         
-        # Identify risk factors
-        risk_factors = self._identify_risk_factors(file_content)
-        
         # Generate risk summary
         risk_summary = self._generate_risk_summary(risk_level, risk_factors, agent_info)
         
         return {
-            'risk_level': risk_level.value,
+            'risk_level': risk_level,
             'risk_score': risk_score,
             'risk_factors': risk_factors,
             'risk_summary': risk_summary,
             'file_path': file_path
         }
     
-    def _calculate_risk_score(self, file_content: str, agent_info: Dict[str, Any]) -> int:
+    def _calculate_risk_score(self, file_content: str, agent_info: Dict[str, Any],
+                              found_factors: Optional[Iterable[str]] = None) -> int:
         """Calculate risk score based on content and agent usage."""
         score = 0
         
@@ -111,9 +126,10 @@ class RiskAssessor:
             score += 1
         
         # Add score for each risk factor found
-        for factor, weight in self.risk_factors.items():
-            if self._contains_risk_factor(file_content, factor):
-                score += weight
+        if found_factors is None:
+            found_factors = self._scan_risk_factors(file_content)
+        for factor in found_factors:
+            score += self.risk_factors.get(factor, 0)
         
         # Additional score for multiple agent types
         agent_types = agent_info.get('agent_types', [])
@@ -122,42 +138,43 @@ class RiskAssessor:
         
         return score
     
-    def _determine_risk_level(self, risk_score: int) -> RiskLevel:
+    def _determine_risk_level(self, risk_score: int) -> str:
         """Determine risk level based on score."""
         if risk_score >= 6:
-            return RiskLevel.HIGH
+            return RISK_HIGH
         elif risk_score >= 3:
-            return RiskLevel.MEDIUM
+            return RISK_MEDIUM
         else:
-            return RiskLevel.LOW
+            return RISK_LOW
     
     def _identify_risk_factors(self, file_content: str) -> List[str]:
         """Identify risk factors present in the file."""
-        factors = []
+        return list(self._scan_risk_factors(file_content))
+    
+    def _scan_risk_factors(self, file_content: str) -> Set[str]:
+        """Scan the content once and return the set of risk factors hit."""
+        factors = set()
+        kw_to_factors = self._kw_to_factors
         
-        for factor, keywords in self.high_risk_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in file_content.lower():
-                    factors.append(factor)
-                    break
+        for keyword in set(self._keyword_re.findall(file_content.lower())):
+            factors.update(kw_to_factors[keyword])
         
-        return list(set(factors))  # Remove duplicates
+        return factors
     
     def _contains_risk_factor(self, file_content: str, factor: str) -> bool:
         """Check if file contains a specific risk factor."""
-        keywords = self.high_risk_keywords.get(factor, [])
-        return any(keyword.lower() in file_content.lower() for keyword in keywords)
+        return factor in self._scan_risk_factors(file_content)
     
-    def _generate_risk_summary(self, risk_level: RiskLevel, risk_factors: List[str], 
+    def _generate_risk_summary(self, risk_level: str, risk_factors: List[str], 
                               agent_info: Dict[str, Any]) -> str:
         """Generate a human-readable risk summary."""
         agent_types = agent_info.get('agent_types', [])
         
         summary = f"This component uses {', '.join(agent_types)} AI agents "
         
-        if risk_level == RiskLevel.HIGH:
+        if risk_level == RISK_HIGH:
             summary += "and poses HIGH business risk due to "
-        elif risk_level == RiskLevel.MEDIUM:
+        elif risk_level == RISK_MEDIUM:
             summary += "and poses MEDIUM business risk due to "
         else:
             summary += "and poses LOW business risk."
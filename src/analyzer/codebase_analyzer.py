@@ -3,6 +3,10 @@ Main codebase analyzer for AutoGraph.
 Coordinates the entire analysis pipeline and builds the hierarchical graph.
 """
 
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime
@@ -10,12 +14,37 @@ from ..utils.logger import get_logger
 from ..utils.file_utils import FileUtils
 from ..parser.file_parser import FileParser
 from ..models.schemas import Graph, GraphMetadata, GraphNode, GraphEdge, NodeLevel, NodeType, EdgeType, ComplexityLevel, TechnicalDepth
-from ..models.graph_models import GraphBuilder, FileCategorizer
-from ..graph_builder.enhanced_graph_builder import EnhancedGraphBuilder
+from ..models.graph_models import GraphBuilder, FileCategorizer, FileInfo
+from ..graph_builder.enhanced_graph_builder import EnhancedGraphBuilder, build_file_to_hld_index
 from ..export.enhanced_exporter import EnhancedExporter
 
 logger = get_logger(__name__)
 
+# Single-pass file-name classifier for backend component layers. The lookahead
+# tests every offset, so overlapping keywords are all seen; layer priority is
+# api > service > model regardless of where each keyword occurs.
+_BACKEND_LAYER_RE = re.compile(
+    r'(?=(?P<api>api|route|endpoint|controller)'
+    r'|(?P<service>service|business|logic)'
+    r'|(?P<model>model|entity|schema))'
+)
+
+# File-derived metadata for symbols whose file has no parse info; merged into
+# each node's own dict, so it is never mutated
+_MISSING_FILE_METADATA = {
+    'line_count': 0,
+    'file_size': 0,
+    'language': 'python',
+    'category': 'backend'
+}
+
+
+@dataclass
+class ParsedFilesIndex:
+    """Per-file aggregates collected in a single pass over the parsed files."""
+    category_files: Dict[str, List[str]] = field(default_factory=dict)
+    total_lines: int = 0
+
 
 class CodebaseAnalyzer:
     """Main analyzer that coordinates the entire analysis pipeline."""
@@ -70,11 +99,14 @@ class CodebaseAnalyzer:
         """Build the hierarchical graph structure from parsing results."""
         logger.info("Building graph structure...")
         
+        # Collect per-file aggregates once for metadata and node grouping
+        index = self._index_parsed_files(parsing_result)
+        
         # Create graph metadata
-        metadata = self._create_graph_metadata(codebase_path, parsing_result)
+        metadata = self._create_graph_metadata(codebase_path, parsing_result, index)
         
         # Create BUSINESS/SYSTEM/IMPLEMENTATION nodes
-        hld_nodes = self._create_business_nodes(parsing_result)
+        hld_nodes = self._create_business_nodes(parsing_result, index)
         lld_nodes = self._create_implementation_nodes(parsing_result)
         
         # Create edges between nodes
@@ -83,14 +115,28 @@ class CodebaseAnalyzer:
         # Build the graph
         graph = Graph(
             metadata=metadata,
-            nodes=list(hld_nodes.values()) + list(lld_nodes.values()),
+            nodes=list(chain(hld_nodes.values(), lld_nodes.values())),
             edges=edges
         )
         
         logger.info(f"Graph built: {len(hld_nodes)} BUSINESS nodes, {len(lld_nodes)} IMPLEMENTATION nodes, {len(edges)} edges")
         return graph
     
-    def _create_graph_metadata(self, codebase_path: str, parsing_result: Dict[str, Any]) -> GraphMetadata:
+    def _index_parsed_files(self, parsing_result: Dict[str, Any]) -> ParsedFilesIndex:
+        """Walk the parsed files once, grouping them by category and summing line counts."""
+        index = ParsedFilesIndex()
+        category_files = defaultdict(list)
+        
+        for file_path, file_data in parsing_result['parsed_files'].items():
+            file_info = file_data['file_info']
+            index.total_lines += file_info.line_count
+            category_files[file_info.category].append(file_path)
+        
+        index.category_files = dict(category_files)
+        return index
+    
+    def _create_graph_metadata(self, codebase_path: str, parsing_result: Dict[str, Any],
+                               index: ParsedFilesIndex) -> GraphMetadata:
         """Create metadata for the graph."""
         stats = parsing_result['parsing_stats']
         
@@ -99,25 +145,18 @@ class CodebaseAnalyzer:
             analysis_timestamp=datetime.now(),
             file_count=stats['total_files'],
             coverage_percentage=stats['coverage_percentage'],
-            total_lines=sum(file_data['file_info'].line_count for file_data in parsing_result['parsed_files'].values()),
+            total_lines=index.total_lines,
             languages=list(stats['languages'].keys()),
             categories=stats['categories']
         )
     
-    def _create_business_nodes(self, parsing_result: Dict[str, Any]) -> Dict[str, GraphNode]:
+    def _create_business_nodes(self, parsing_result: Dict[str, Any],
+                               index: ParsedFilesIndex) -> Dict[str, GraphNode]:
         """Create Business-level nodes (formerly HLD)."""
         hld_nodes = {}
         
-        # Group files by category to create HLD nodes
-        category_files = {}
-        for file_path, file_data in parsing_result['parsed_files'].items():
-            category = file_data['file_info'].category
-            if category not in category_files:
-                category_files[category] = []
-            category_files[category].append(file_path)
-        
         # Create HLD nodes for each category
-        for category, files in category_files.items():
+        for category, files in index.category_files.items():
             if category == 'backend':
                 # Create separate nodes for different backend components
                 self._create_backend_hld_nodes(files, parsing_result, hld_nodes)
@@ -143,16 +182,16 @@ class CodebaseAnalyzer:
         model_files = []
         utility_files = []
         
+        layer_files = {
+            'api': api_files,
+            'service': service_files,
+            'model': model_files,
+            'utility': utility_files
+        }
+        
         for file_path in files:
             file_name = Path(file_path).name.lower()
-            if any(keyword in file_name for keyword in ['api', 'route', 'endpoint', 'controller']):
-                api_files.append(file_path)
-            elif any(keyword in file_name for keyword in ['service', 'business', 'logic']):
-                service_files.append(file_path)
-            elif any(keyword in file_name for keyword in ['model', 'entity', 'schema']):
-                model_files.append(file_path)
-            else:
-                utility_files.append(file_path)
+            layer_files[self._classify_backend_file(file_name)].append(file_path)
         
         # Create HLD nodes for each backend component type
         if api_files:
@@ -195,34 +234,49 @@ class CodebaseAnalyzer:
                 metadata=self._create_node_metadata(utility_files, parsing_result)
             )
     
+    def _classify_backend_file(self, file_name: str) -> str:
+        """Classify a lowercase backend file name as api, service, model or utility."""
+        layer = 'utility'
+        for match in _BACKEND_LAYER_RE.finditer(file_name):
+            found = match.lastgroup
+            if found == 'api':
+                return found
+            if found == 'service':
+                layer = found
+            elif layer == 'utility':
+                layer = found
+        return layer
+    
     def _create_implementation_nodes(self, parsing_result: Dict[str, Any]) -> Dict[str, GraphNode]:
         """Create Implementation-level nodes (formerly LLD)."""
         lld_nodes = {}
         
         for file_path, file_data in parsing_result['parsed_files'].items():
+            file_stem = Path(file_path).stem
+            
             # Create nodes for functions
             for func_name in file_data['functions']:
-                node_id = f"function_{func_name}_{Path(file_path).stem}"
+                node_id = f"function_{func_name}_{file_stem}"
                 lld_nodes[node_id] = GraphNode(
                     id=node_id,
                     name=func_name,
                     type=NodeType.FUNCTION,
                     level=NodeLevel.IMPLEMENTATION,
-                    files=[file_path],
-                    functions=[func_name],
+                    files=(file_path,),
+                    functions=(func_name,),
                     metadata=self._create_function_metadata(func_name, file_path, parsing_result)
                 )
             
             # Create nodes for classes
             for class_name in file_data['classes']:
-                node_id = f"class_{class_name}_{Path(file_path).stem}"
+                node_id = f"class_{class_name}_{file_stem}"
                 lld_nodes[node_id] = GraphNode(
                     id=node_id,
                     name=class_name,
                     type=NodeType.CLASS,
                     level=NodeLevel.IMPLEMENTATION,
-                    files=[file_path],
-                    classes=[class_name],
+                    files=(file_path,),
+                    classes=(class_name,),
                     metadata=self._create_class_metadata(class_name, file_path, parsing_result)
                 )
         
@@ -231,21 +285,28 @@ class CodebaseAnalyzer:
     def _create_graph_edges(self, parsing_result: Dict[str, Any], hld_nodes: Dict[str, GraphNode], lld_nodes: Dict[str, GraphNode]) -> List[GraphEdge]:
         """Create edges between nodes."""
         edges = []
+        file_to_hld = build_file_to_hld_index(hld_nodes)
+        
+        # Hot loop over every LLD node: bind the lookups once
+        add_edge = edges.append
+        find_parent = file_to_hld.get
+        contains = EdgeType.CONTAINS
         
         # Create containment edges (BUSINESS contains IMPLEMENTATION)
         for lld_node in lld_nodes.values():
+            lld_id = lld_node.id
             for file_path in lld_node.files:
                 # Find parent BUSINESS node
-                parent_hld = self._find_parent_hld_node(file_path, hld_nodes)
-                if parent_hld:
-                    edges.append(GraphEdge(
+                parent_hld = find_parent(file_path)
+                if parent_hld is not None:
+                    add_edge(GraphEdge(
                         from_node=parent_hld.id,
-                        to_node=lld_node.id,
-                        type=EdgeType.CONTAINS,
+                        to_node=lld_id,
+                        type=contains,
                         metadata={'relationship_type': 'hierarchy'}
                     ))
                     lld_node.parent = parent_hld.id
-                    parent_hld.children.append(lld_node.id)
+                    parent_hld.children.append(lld_id)
         
         # Create import edges between LLD nodes
         import_edges = self._create_import_edges(parsing_result, lld_nodes)
@@ -253,13 +314,6 @@ class CodebaseAnalyzer:
         
         return edges
     
-    def _find_parent_hld_node(self, file_path: str, hld_nodes: Dict[str, GraphNode]) -> Optional[GraphNode]:
-        """Find the BUSINESS node that contains a given file."""
-        for hld_node in hld_nodes.values():
-            if file_path in hld_node.files:
-                return hld_node
-        return None
-    
     def _create_import_edges(self, parsing_result: Dict[str, Any], lld_nodes: Dict[str, GraphNode]) -> List[GraphEdge]:
         """Create edges based on import relationships."""
         edges = []
@@ -274,10 +328,12 @@ class CodebaseAnalyzer:
         """Create metadata for a node."""
         total_lines = 0
         total_size = 0
+        parsed_files = parsing_result['parsed_files']
         
         for file_path in files:
-            if file_path in parsing_result['parsed_files']:
-                file_info = parsing_result['parsed_files'][file_path]['file_info']
+            file_data = parsed_files.get(file_path)
+            if file_data is not None:
+                file_info = file_data['file_info']
                 total_lines += file_info.line_count
                 total_size += file_info.size
         
@@ -295,54 +351,35 @@ class CodebaseAnalyzer:
     def _create_function_metadata(self, func_name: str, file_path: str, parsing_result: Dict[str, Any]) -> Dict[str, Any]:
         """Create metadata for a function node."""
         file_data = parsing_result['parsed_files'].get(file_path, {})
-        file_info = file_data.get('file_info')
-        
-        if file_info:
-            return {
-                'purpose': f"Function: {func_name}",
-                'complexity': ComplexityLevel.LOW,
-                'dependencies': file_data.get('imports', []),
-                'line_count': file_info.line_count,
-                'file_size': file_info.size,
-                'language': file_info.language,
-                'category': file_info.category
-            }
-        else:
-            return {
-                'purpose': f"Function: {func_name}",
-                'complexity': ComplexityLevel.LOW,
-                'dependencies': file_data.get('imports', []),
-                'line_count': 0,
-                'file_size': 0,
-                'language': 'python',
-                'category': 'backend'
-            }
+        
+        return {
+            'purpose': f"Function: {func_name}",
+            'complexity': ComplexityLevel.LOW,
+            'dependencies': file_data.get('imports', []),
+            **self._file_info_metadata(file_data.get('file_info'))
+        }
     
     def _create_class_metadata(self, class_name: str, file_path: str, parsing_result: Dict[str, Any]) -> Dict[str, Any]:
         """Create metadata for a class node."""
         file_data = parsing_result['parsed_files'].get(file_path, {})
-        file_info = file_data.get('file_info')
-        
-        if file_info:
-            return {
-                'purpose': f"Class: {class_name}",
-                'complexity': ComplexityLevel.MEDIUM,
-                'dependencies': file_data.get('imports', []),
-                'line_count': file_info.line_count,
-                'file_size': file_info.size,
-                'language': file_info.language,
-                'category': file_info.category
-            }
-        else:
-            return {
-                'purpose': f"Class: {class_name}",
-                'complexity': ComplexityLevel.MEDIUM,
-                'dependencies': file_data.get('imports', []),
-                'line_count': 0,
-                'file_size': 0,
-                'language': 'python',
-                'category': 'backend'
-            }
+        
+        return {
+            'purpose': f"Class: {class_name}",
+            'complexity': ComplexityLevel.MEDIUM,
+            'dependencies': file_data.get('imports', []),
+            **self._file_info_metadata(file_data.get('file_info'))
+        }
+    
+    def _file_info_metadata(self, file_info: Optional[FileInfo]) -> Dict[str, Any]:
+        """Get the file-derived metadata fields, sharing one template for unparsed files."""
+        if not file_info:
+            return _MISSING_FILE_METADATA
+        return {
+            'line_count': file_info.line_count,
+            'file_size': file_info.size,
+            'language': file_info.language,
+            'category': file_info.category
+        }
     
     def _export_analysis_results(self, graph: Graph, codebase_path: str) -> Dict[str, str]:
         """Export analysis results in multiple formats."""
@@ -371,6 +408,15 @@ class CodebaseAnalyzer:
         # Get enhanced statistics
         enhanced_stats = self.enhanced_graph_builder.get_enhanced_statistics()
         
+        # Tally node levels in a single pass
+        business_nodes = 0
+        implementation_nodes = 0
+        for node in graph.nodes:
+            if node.level == NodeLevel.BUSINESS:
+                business_nodes += 1
+            elif node.level == NodeLevel.IMPLEMENTATION:
+                implementation_nodes += 1
+        
         return {
             'success': True,
             'codebase_path': codebase_path,
@@ -390,8 +436,8 @@ class CodebaseAnalyzer:
                 'total_files': parsing_result['parsing_stats']['total_files'],
                 'successful_parses': parsing_result['parsing_stats']['successful_parses'],
                 'coverage_percentage': parsing_result['parsing_stats']['coverage_percentage'],
-                'business_nodes': len([n for n in graph.nodes if n.level == NodeLevel.BUSINESS]),
-                'implementation_nodes': len([n for n in graph.nodes if n.level == NodeLevel.IMPLEMENTATION]),
+                'business_nodes': business_nodes,
+                'implementation_nodes': implementation_nodes,
                 'total_edges': len(graph.edges),
                 'semantic_analysis': enhanced_stats['semantic_analysis'],
                 'relationship_mapping': enhanced_stats['relationship_mapping'],
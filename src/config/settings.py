@@ -3,7 +3,9 @@ Application settings and configuration management.
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -25,11 +27,17 @@ class Settings:
     LLM_CACHE_ENABLED: bool = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
     LLM_MAX_TOKENS: int = int(os.getenv('LLM_MAX_TOKENS', '2000'))
     LLM_TEMPERATURE: float = float(os.getenv('LLM_TEMPERATURE', '0.1'))
+    # Output-token ceiling of OPENAI_MODEL (gpt-4o-mini: 16384); caps batched requests
+    LLM_MAX_OUTPUT_TOKENS: int = int(os.getenv('LLM_MAX_OUTPUT_TOKENS', '16384'))
     
     # Quick disable for testing (set to 'false' to disable LLM calls completely)
     LLM_DISABLE_FOR_TESTING: bool = os.getenv('LLM_DISABLE_FOR_TESTING', 'true').lower() == 'true'
     
+    # Settings are read from the environment once at import, so the derived LLM
+    # config is cached; call `.cache_clear()` on these methods after overriding attributes.
+    
     @classmethod
+    @lru_cache(maxsize=1)
     def validate_llm_config(cls) -> bool:
         """Validate that LLM configuration is complete."""
         if not cls.LLM_ENABLED or cls.LLM_DISABLE_FOR_TESTING:
@@ -39,17 +47,19 @@ class Settings:
         return True
     
     @classmethod
-    def get_llm_config(cls) -> dict:
-        """Get LLM configuration as a dictionary."""
-        return {
+    @lru_cache(maxsize=1)
+    def get_llm_config(cls) -> Mapping[str, Any]:
+        """Get LLM configuration as a read-only mapping."""
+        return MappingProxyType({
             'api_key': cls.OPENAI_API_KEY,
             'model': cls.OPENAI_MODEL,
             'max_tokens': cls.LLM_MAX_TOKENS,
+            'max_output_tokens': cls.LLM_MAX_OUTPUT_TOKENS,
             'temperature': cls.LLM_TEMPERATURE,
             'enabled': cls.LLM_ENABLED and not cls.LLM_DISABLE_FOR_TESTING,
             'cache_enabled': cls.LLM_CACHE_ENABLED,
             'disabled_for_testing': cls.LLM_DISABLE_FOR_TESTING
-        }
+        })
 
 
 # Global settings instance
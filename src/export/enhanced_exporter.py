@@ -4,17 +4,110 @@ Provides multiple export formats and metadata enrichment.
 """
 
 import json
+import os
 import yaml
 import csv
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from ..utils.logger import get_logger
 from ..models.schemas import Graph, GraphNode, GraphEdge, NodeLevel, NodeType, EdgeType
 from ..visualization.graph_visualizer import GraphVisualizer
 
+try:
+    import orjson
+    _ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                       | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 logger = get_logger(__name__)
 
+# Number of node/edge records serialized before each write in _export_json
+JSON_WRITE_BATCH_SIZE = 4096
+
+# Export detail levels: 'minimal' writes plain nodes and edges, 'standard' adds
+# statistics and per-record enrichment, 'full' adds the whole-graph analyses
+DETAIL_LEVELS = ('minimal', 'standard', 'full')
+
+# Closing section of the export report
+_EXPORT_REPORT_NEXT_STEPS = (
+    "## Next Steps",
+    "1. Open HTML file in a web browser for interactive visualization",
+    "2. Use DOT file with Graphviz for static diagrams",
+    "3. Import JSON/YAML files into other tools for further analysis",
+    "4. Use CSV file for spreadsheet analysis"
+)
+
+# Buffer size for export files, so large exports reach disk in few write() calls
+EXPORT_WRITE_BUFFER_SIZE = 1 << 20
+
+# Columns of node and edge rows in the CSV export
+CSV_NODE_FIELDS = (
+    'type', 'id', 'name', 'node_type', 'level', 'file_count', 'function_count',
+    'class_count', 'parent', 'child_count', 'complexity', 'purpose'
+)
+CSV_EDGE_FIELDS = ('type', 'from_node', 'to_node', 'edge_type', 'description')
+
+# Numeric ranking used to order nodes by complexity
+_COMPLEXITY_SCORES = {'low': 1, 'medium': 2, 'high': 3}
+
+# Edge types treated as dependencies
+_DEPENDENCY_EDGE_TYPES = frozenset({EdgeType.IMPORTS, EdgeType.CALLS, EdgeType.DEPENDS})
+
+# (edge_strength, is_hierarchical, is_dependency) per edge type
+_DEFAULT_EDGE_INFO = ('medium', False, False)
+_EDGE_INFO = {
+    EdgeType.CONTAINS: ('strong', True, False),
+    EdgeType.INHERITS: ('strong', False, False),
+    EdgeType.IMPORTS: ('medium', False, True),
+    EdgeType.CALLS: ('weak', False, True),
+    EdgeType.DEPENDS: ('medium', False, True)
+}
+
+
+def _file_suffix(file_path: str) -> str:
+    """Return the same suffix as Path(file_path).suffix without building a Path."""
+    name = os.path.basename(file_path)
+    dot = name.rfind('.')
+    # Hidden files ('.env') and names ending in a dot have no suffix
+    return name[dot:] if 0 < dot < len(name) - 1 else ''
+
+
+@dataclass
+class NodeScan:
+    """Per-node aggregates collected in a single pass over graph.nodes."""
+    hld_nodes: int = 0
+    lld_nodes: int = 0
+    node_types: Dict[str, int] = field(default_factory=dict)
+    complexity_distribution: Dict[str, int] = field(default_factory=lambda: {'low': 0, 'medium': 0, 'high': 0})
+    total_children: int = 0
+    nodes_without_parents: int = 0
+    nodes_without_children: int = 0
+    business_nodes: List[Dict[str, Any]] = field(default_factory=list)
+    implementation_components: List[Dict[str, Any]] = field(default_factory=list)
+    by_node_type: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    by_level: Dict[str, List[Dict[str, Any]]] = field(
+        default_factory=lambda: {'BUSINESS': [], 'SYSTEM': [], 'IMPLEMENTATION': []}
+    )
+    complexity_scored: List[Tuple[GraphNode, int]] = field(default_factory=list)
+    # Enum values resolved once, aligned with graph.nodes and graph.edges
+    node_type_values: List[str] = field(default_factory=list)
+    node_level_values: List[str] = field(default_factory=list)
+    edge_type_values: List[str] = field(default_factory=list)
+    # Edges grouped by type, each group in graph order
+    edges_by_type: Dict[EdgeType, List[GraphEdge]] = field(default_factory=dict)
+
 
 class EnhancedExporter:
     """Enhanced exporter with multiple formats and metadata enrichment."""
@@ -23,11 +116,18 @@ class EnhancedExporter:
         self.visualizer = GraphVisualizer()
         # JSON is canonical; other formats are disabled by default (can be re-enabled later)
         self.export_formats = ['json']
+        self._format_writers = {
+            'json': self._export_json
+        }
     
-    def export_graph(self, graph: Graph, output_dir: str, formats: List[str] = None) -> Dict[str, str]:
+    def export_graph(self, graph: Graph, output_dir: str, formats: List[str] = None,
+                     detail_level: str = 'full') -> Dict[str, str]:
         """Export graph in multiple formats."""
         logger.info(f"Exporting graph to {output_dir}")
         
+        if detail_level not in DETAIL_LEVELS:
+            raise ValueError(f"Unknown export detail level: {detail_level}")
+        
         if formats is None:
             formats = self.export_formats
         
@@ -36,94 +136,193 @@ class EnhancedExporter:
         
         export_results = {}
         
-        # Generate timestamp for file naming
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # One timestamp for file naming and every file's metadata, so all files of
+        # an export agree
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        export_timestamp = now.isoformat()
         
+        jobs = []
         for format_type in formats:
             if format_type not in self.export_formats:
                 logger.warning(f"Unsupported export format: {format_type}")
                 continue
-            
-            try:
-                if format_type == 'json':
-                    output_path = output_dir / f"autograph_graph_{timestamp}.json"
-                    result = self._export_json(graph, str(output_path))
-                    export_results['json'] = str(output_path)
-                
-                # Other formats intentionally disabled for now
-                
-                logger.info(f"Successfully exported {format_type} to {output_path}")
-                
-            except Exception as e:
-                logger.error(f"Failed to export {format_type}: {e}")
-                export_results[f"{format_type}_error"] = str(e)
+            # Other formats intentionally disabled for now
+            writer = self._format_writers.get(format_type)
+            if writer is None:
+                continue
+            output_path = output_dir / f"autograph_graph_{timestamp}.{format_type}"
+            jobs.append((format_type, writer, output_path))
+        
+        # Scan the nodes once up front so each writer only serializes
+        scan = self._scan_nodes(graph) if jobs and detail_level != 'minimal' else None
+        
+        # A single format (the default) is written directly; several independent
+        # formats are written concurrently
+        if len(jobs) <= 1:
+            for format_type, writer, output_path in jobs:
+                self._record_export(
+                    export_results, format_type, output_path,
+                    partial(writer, graph, str(output_path), scan, detail_level, export_timestamp)
+                )
+            return export_results
+        
+        max_workers = max(1, min(len(jobs), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (format_type, output_path, executor.submit(
+                    writer, graph, str(output_path), scan, detail_level, export_timestamp
+                ))
+                for format_type, writer, output_path in jobs
+            ]
+            for format_type, output_path, future in futures:
+                self._record_export(export_results, format_type, output_path, future.result)
         
         return export_results
     
-    def _export_json(self, graph: Graph, output_path: str) -> Dict[str, Any]:
-        """Export graph as enhanced JSON with metadata."""
-        enhanced_data = {
-            'metadata': {
-                'export_timestamp': datetime.now().isoformat(),
-                'export_format': 'enhanced_json',
-                'version': '1.0',
-                'graph_metadata': graph.metadata.dict() if graph.metadata else {},
-                'statistics': self._generate_graph_statistics(graph)
-            },
-            'nodes': [],
-            'edges': [],
-            'hierarchical_structure': self._generate_hierarchical_structure(graph),
-            'dependency_analysis': self._generate_dependency_analysis(graph),
-            'complexity_analysis': self._generate_complexity_analysis(graph)
+    def _record_export(self, export_results: Dict[str, str], format_type: str,
+                       output_path: Path, write: Callable[[], Any]) -> None:
+        """Run or wait for one format's export and record its path or error."""
+        try:
+            write()
+            export_results[format_type] = str(output_path)
+            logger.info(f"Successfully exported {format_type} to {output_path}")
+        except Exception as e:
+            logger.error(f"Failed to export {format_type}: {e}")
+            export_results[f"{format_type}_error"] = str(e)
+    
+    def _export_json(self, graph: Graph, output_path: str, scan: Optional[NodeScan] = None,
+                     detail_level: str = 'full', export_timestamp: Optional[str] = None) -> None:
+        """Export graph as enhanced JSON with metadata, streaming nodes and edges to disk."""
+        enrich = detail_level != 'minimal'
+        if scan is None and enrich:
+            scan = self._scan_nodes(graph)
+        
+        metadata = {
+            'export_timestamp': export_timestamp or datetime.now().isoformat(),
+            'export_format': 'enhanced_json',
+            'version': '1.0',
+            'graph_metadata': graph.metadata.dict() if graph.metadata else {}
         }
+        if enrich:
+            metadata['statistics'] = self._generate_graph_statistics(graph, scan)
         
-        # Enhanced node data
-        for node in graph.nodes:
-            node_data = {
-                'id': node.id,
-                'name': node.name,
-                'type': node.type.value,
-                'level': node.level.value,
-                'metadata': node.metadata,
-                'files': node.files,
-                'functions': node.functions,
-                'classes': node.classes,
-                'parent': node.parent,
-                'children': node.children,
-                'enhanced_metadata': self._enrich_node_metadata(node)
+        sections = {
+            'metadata': metadata,
+            'nodes': self._iter_json_nodes(graph, scan, enrich),
+            'edges': self._iter_json_edges(graph, scan, enrich)
+        }
+        if detail_level == 'full':
+            sections['hierarchical_structure'] = self._generate_hierarchical_structure(graph, scan)
+            sections['dependency_analysis'] = self._generate_dependency_analysis(graph, scan)
+            sections['complexity_analysis'] = self._generate_complexity_analysis(graph, scan)
+        
+        # Same layout as json.dump(indent=2), but list sections are written one
+        # record at a time so the full document is never held in memory
+        with open(output_path, 'wb', buffering=EXPORT_WRITE_BUFFER_SIZE) as f:
+            f.write(b'{')
+            for index, (key, value) in enumerate(sections.items()):
+                f.write(b',\n  ' if index else b'\n  ')
+                f.write(f"{json.dumps(key)}: ".encode('utf-8'))
+                if isinstance(value, dict):
+                    f.write(self._dump_json_value(value, 1))
+                    continue
+                
+                # Records are joined and written in batches to keep write calls down
+                batch = []
+                wrote_item = False
+                for item in value:
+                    batch.append(b',\n    ' if wrote_item else b'[\n    ')
+                    batch.append(self._dump_json_value(item, 2))
+                    wrote_item = True
+                    if len(batch) >= 2 * JSON_WRITE_BATCH_SIZE:
+                        f.write(b''.join(batch))
+                        batch.clear()
+                f.write(b''.join(batch))
+                f.write(b'\n  ]' if wrote_item else b'[]')
+            f.write(b'\n}')
+    
+    def _dump_json_value(self, value: Any, depth: int) -> bytes:
+        """Serialize a value to UTF-8 with indent=2, shifted to sit `depth` levels deep."""
+        data = None
+        if orjson is not None:
+            # Datetimes and dataclasses go through default=str as they do with json;
+            # orjson writes non-ASCII text raw where json escapes it, so that output
+            # is redone with json to keep the file identical either way
+            data = orjson.dumps(value, default=str, option=_ORJSON_OPTIONS)
+            if not data.isascii():
+                data = None
+        if data is None:
+            data = json.dumps(value, indent=2, default=str).encode('utf-8')
+        # Newlines inside JSON strings are escaped, so every raw newline is layout
+        return data.replace(b'\n', b'\n' + b'  ' * depth)
+    
+    def _iter_json_nodes(self, graph: Graph, scan: Optional[NodeScan],
+                         enrich: bool = True) -> Iterator[Dict[str, Any]]:
+        """Yield node records for JSON export, enriched unless `enrich` is False."""
+        if scan is not None:
+            type_values, level_values = scan.node_type_values, scan.node_level_values
+        else:
+            type_values = [node.type.value for node in graph.nodes]
+            level_values = [node.level.value for node in graph.nodes]
+        
+        for node, node_type, level in zip(graph.nodes, type_values, level_values):
+            # Read fields straight from the model's __dict__ rather than through
+            # attribute lookup on the pydantic class
+            fields = node.__dict__
+            record = {
+                'id': fields['id'],
+                'name': fields['name'],
+                'type': node_type,
+                'level': level,
+                'metadata': fields['metadata'],
+                'files': fields['files'],
+                'functions': fields['functions'],
+                'classes': fields['classes'],
+                'parent': fields['parent'],
+                'children': fields['children']
             }
-            enhanced_data['nodes'].append(node_data)
-        
-        # Enhanced edge data
-        for edge in graph.edges:
-            edge_data = {
-                'from_node': edge.from_node,
-                'to_node': edge.to_node,
-                'type': edge.type.value,
-                'metadata': edge.metadata,
-                'enhanced_metadata': self._enrich_edge_metadata(edge)
+            if enrich:
+                record['enhanced_metadata'] = self._enrich_node_metadata(node)
+            yield record
+    
+    def _iter_json_edges(self, graph: Graph, scan: Optional[NodeScan],
+                         enrich: bool = True) -> Iterator[Dict[str, Any]]:
+        """Yield edge records for JSON export, enriched unless `enrich` is False."""
+        if scan is not None:
+            type_values = scan.edge_type_values
+        else:
+            type_values = [edge.type.value for edge in graph.edges]
+        
+        for edge, edge_type in zip(graph.edges, type_values):
+            fields = edge.__dict__
+            record = {
+                'from_node': fields['from_node'],
+                'to_node': fields['to_node'],
+                'type': edge_type,
+                'metadata': fields['metadata']
             }
-            enhanced_data['edges'].append(edge_data)
-        
-        with open(output_path, 'w') as f:
-            json.dump(enhanced_data, f, indent=2, default=str)
-        
-        return enhanced_data
+            if enrich:
+                record['enhanced_metadata'] = self._enrich_edge_metadata(edge)
+            yield record
     
-    def _export_yaml(self, graph: Graph, output_path: str) -> Dict[str, Any]:
+    def _export_yaml(self, graph: Graph, output_path: str, scan: Optional[NodeScan] = None,
+                     detail_level: str = 'full', export_timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Export graph as YAML with enhanced metadata."""
         yaml_data = {
             'metadata': {
-                'export_timestamp': datetime.now().isoformat(),
+                'export_timestamp': export_timestamp or datetime.now().isoformat(),
                 'export_format': 'enhanced_yaml',
                 'version': '1.0',
-                'graph_metadata': graph.metadata.dict() if graph.metadata else {},
-                'statistics': self._generate_graph_statistics(graph)
+                'graph_metadata': graph.metadata.model_dump(mode='json') if graph.metadata else {}
             },
             'nodes': [],
-            'edges': [],
-            'hierarchical_structure': self._generate_hierarchical_structure(graph)
+            'edges': []
         }
+        if detail_level != 'minimal':
+            yaml_data['metadata']['statistics'] = self._generate_graph_statistics(graph, scan)
+        if detail_level == 'full':
+            yaml_data['hierarchical_structure'] = self._generate_hierarchical_structure(graph, scan)
         
         # Node data
         for node in graph.nodes:
@@ -132,10 +331,10 @@ class EnhancedExporter:
                 'name': node.name,
                 'type': node.type.value,
                 'level': node.level.value,
-                'files': node.files,
-                'functions': node.functions,
-                'classes': node.classes,
-                'metadata': node.metadata
+                'files': list(node.files),
+                'functions': list(node.functions),
+                'classes': list(node.classes),
+                'metadata': node.metadata.model_dump(mode='json')
             }
             yaml_data['nodes'].append(node_data)
         
@@ -149,18 +348,30 @@ class EnhancedExporter:
             }
             yaml_data['edges'].append(edge_data)
         
-        with open(output_path, 'w') as f:
-            yaml.dump(yaml_data, f, default_flow_style=False, sort_keys=False)
+        # Emit the whole document in memory, then hand it to the file in one write
+        document = yaml.dump(
+            yaml_data, Dumper=YamlDumper, encoding='utf-8', default_flow_style=False, sort_keys=False
+        )
+        with open(output_path, 'wb', buffering=EXPORT_WRITE_BUFFER_SIZE) as f:
+            f.write(document)
         
         return yaml_data
     
-    def _export_csv(self, graph: Graph, output_path: str) -> List[Dict[str, Any]]:
+    def _export_csv(self, graph: Graph, output_path: str, scan: Optional[NodeScan] = None,
+                    detail_level: str = 'full', export_timestamp: Optional[str] = None) -> None:
         """Export graph as CSV with node and edge information."""
-        csv_data = []
+        if not graph.nodes and not graph.edges:
+            return
         
-        # Add nodes
-        for node in graph.nodes:
-            node_row = {
+        # Header is the sorted union of the columns of the row kinds present;
+        # columns a row does not have are left empty
+        header = sorted(
+            (set(CSV_NODE_FIELDS) if graph.nodes else set()) |
+            (set(CSV_EDGE_FIELDS) if graph.edges else set())
+        )
+        
+        node_rows = (
+            {
                 'type': 'node',
                 'id': node.id,
                 'name': node.name,
@@ -171,112 +382,149 @@ class EnhancedExporter:
                 'class_count': len(node.classes),
                 'parent': node.parent or '',
                 'child_count': len(node.children),
-                'complexity': node.metadata.complexity.value if hasattr(node.metadata, 'complexity') and node.metadata.complexity else '',
+                'complexity': self._complexity_value(node) or '',
                 'purpose': node.metadata.purpose if hasattr(node.metadata, 'purpose') and node.metadata.purpose else ''
             }
-            csv_data.append(node_row)
-        
-        # Add edges
-        for edge in graph.edges:
-            edge_row = {
+            for node in graph.nodes
+        )
+        edge_rows = (
+            {
                 'type': 'edge',
                 'from_node': edge.from_node,
                 'to_node': edge.to_node,
                 'edge_type': edge.type.value,
                 'description': edge.metadata.get('description', '') if edge.metadata else ''
             }
-            csv_data.append(edge_row)
-        
-        # Write CSV
-        if csv_data:
-            # Get all possible fieldnames from both nodes and edges
-            all_fieldnames = set()
-            for row in csv_data:
-                all_fieldnames.update(row.keys())
-            
-            fieldnames = sorted(list(all_fieldnames))
-            with open(output_path, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(csv_data)
-        
-        return csv_data
+            for edge in graph.edges
+        )
+        rows = ([row.get(name, '') for name in header] for row in chain(node_rows, edge_rows))
+        
+        with open(output_path, 'w', newline='', buffering=EXPORT_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
     
-    def _generate_graph_statistics(self, graph: Graph) -> Dict[str, Any]:
-        """Generate comprehensive graph statistics."""
-        hld_nodes = [n for n in graph.nodes if n.level == NodeLevel.BUSINESS]
-        lld_nodes = [n for n in graph.nodes if n.level == NodeLevel.IMPLEMENTATION]
+    @staticmethod
+    def _complexity_value(node: GraphNode) -> Optional[str]:
+        """Return the node's complexity value, or None if it has none."""
+        try:
+            complexity = node.metadata.complexity
+        except AttributeError:
+            return None
+        return complexity.value if complexity else None
+    
+    def _scan_nodes(self, graph: Graph) -> NodeScan:
+        """Collect node statistics, hierarchy and complexity data in one pass."""
+        scan = NodeScan()
+        node_types = scan.node_types
+        complexity_dist = scan.complexity_distribution
+        by_node_type = scan.by_node_type
+        by_level = scan.by_level
+        add_type_value = scan.node_type_values.append
+        add_level_value = scan.node_level_values.append
         
-        # Node type distribution
-        node_types = {}
         for node in graph.nodes:
+            metadata = node.metadata
             node_type = node.type.value
+            level = node.level
+            level_value = level.value
+            children = node.children
+            add_type_value(node_type)
+            add_level_value(level_value)
+            
+            # Node type distribution
             node_types[node_type] = node_types.get(node_type, 0) + 1
+            
+            # Complexity distribution and ranking
+            complexity = self._complexity_value(node)
+            if complexity:
+                complexity_dist[complexity] = complexity_dist.get(complexity, 0) + 1
+                scan.complexity_scored.append((node, _COMPLEXITY_SCORES.get(complexity, 0)))
+            
+            # Parent/child counts
+            scan.total_children += len(children)
+            if not node.parent:
+                scan.nodes_without_parents += 1
+            if not children:
+                scan.nodes_without_children += 1
+            
+            # Hierarchy
+            if level == NodeLevel.BUSINESS:
+                scan.hld_nodes += 1
+                scan.business_nodes.append({
+                    'id': node.id,
+                    'name': node.name,
+                    'type': node_type,
+                    'child_count': len(children),
+                    'children': children
+                })
+            elif level == NodeLevel.IMPLEMENTATION:
+                scan.lld_nodes += 1
+                scan.implementation_components.append({
+                    'id': node.id,
+                    'name': node.name,
+                    'type': node_type,
+                    'parent': node.parent,
+                    'files': node.files,
+                    'function_count': len(node.functions),
+                    'class_count': len(node.classes)
+                })
+            
+            # Complexity by node type and level
+            complexity_info = {
+                'id': node.id,
+                'name': node.name,
+                'complexity': metadata.get('complexity', '').value if metadata and 'complexity' in metadata else 'unknown',
+                'file_count': len(node.files),
+                'function_count': len(node.functions),
+                'class_count': len(node.classes)
+            }
+            by_node_type.setdefault(node_type, []).append(complexity_info)
+            by_level[level_value].append(complexity_info)
         
-        # Edge type distribution
-        edge_types = {}
+        edges_by_type = scan.edges_by_type
+        add_edge_type_value = scan.edge_type_values.append
         for edge in graph.edges:
-            edge_type = edge.type.value
-            edge_types[edge_type] = edge_types.get(edge_type, 0) + 1
+            edge_type = edge.type
+            add_edge_type_value(edge_type.value)
+            edges_by_type.setdefault(edge_type, []).append(edge)
         
-        # Complexity distribution
-        complexity_dist = {'low': 0, 'medium': 0, 'high': 0}
-        for node in graph.nodes:
-            if node.metadata and hasattr(node.metadata, 'complexity') and node.metadata.complexity:
-                complexity = node.metadata.complexity.value
-                complexity_dist[complexity] = complexity_dist.get(complexity, 0) + 1
+        return scan
+    
+    def _generate_graph_statistics(self, graph: Graph, scan: Optional[NodeScan] = None) -> Dict[str, Any]:
+        """Generate comprehensive graph statistics."""
+        if scan is None:
+            scan = self._scan_nodes(graph)
+        
+        # Edge type distribution
+        edge_types = dict(Counter(scan.edge_type_values))
         
         return {
             'total_nodes': len(graph.nodes),
-            'hld_nodes': len(hld_nodes),
-            'lld_nodes': len(lld_nodes),
+            'hld_nodes': scan.hld_nodes,
+            'lld_nodes': scan.lld_nodes,
             'total_edges': len(graph.edges),
-            'node_type_distribution': node_types,
+            'node_type_distribution': scan.node_types,
             'edge_type_distribution': edge_types,
-            'complexity_distribution': complexity_dist,
-            'average_children_per_node': sum(len(n.children) for n in graph.nodes) / len(graph.nodes) if graph.nodes else 0,
-            'nodes_without_parents': len([n for n in graph.nodes if not n.parent]),
-            'nodes_without_children': len([n for n in graph.nodes if not n.children])
+            'complexity_distribution': scan.complexity_distribution,
+            'average_children_per_node': scan.total_children / len(graph.nodes) if graph.nodes else 0,
+            'nodes_without_parents': scan.nodes_without_parents,
+            'nodes_without_children': scan.nodes_without_children
         }
     
-    def _generate_hierarchical_structure(self, graph: Graph) -> Dict[str, Any]:
+    def _generate_hierarchical_structure(self, graph: Graph, scan: Optional[NodeScan] = None) -> Dict[str, Any]:
         """Generate hierarchical structure analysis."""
-        hld_nodes = [n for n in graph.nodes if n.level == NodeLevel.BUSINESS]
-        lld_nodes = [n for n in graph.nodes if n.level == NodeLevel.IMPLEMENTATION]
+        if scan is None:
+            scan = self._scan_nodes(graph)
         
         hierarchy = {
-            'business_nodes': [],
-            'implementation_components': [],
+            'business_nodes': scan.business_nodes,
+            'implementation_components': scan.implementation_components,
             'containment_relationships': []
         }
         
-        # Business nodes
-        for node in hld_nodes:
-            module_info = {
-                'id': node.id,
-                'name': node.name,
-                'type': node.type.value,
-                'child_count': len(node.children),
-                'children': node.children
-            }
-            hierarchy['business_nodes'].append(module_info)
-        
-        # Implementation components
-        for node in lld_nodes:
-            component_info = {
-                'id': node.id,
-                'name': node.name,
-                'type': node.type.value,
-                'parent': node.parent,
-                'files': node.files,
-                'function_count': len(node.functions),
-                'class_count': len(node.classes)
-            }
-            hierarchy['implementation_components'].append(component_info)
-        
         # Containment relationships
-        containment_edges = [e for e in graph.edges if e.type == EdgeType.CONTAINS]
-        for edge in containment_edges:
+        for edge in scan.edges_by_type.get(EdgeType.CONTAINS, []):
             containment_info = {
                 'parent': edge.from_node,
                 'child': edge.to_node,
@@ -286,77 +534,49 @@ class EnhancedExporter:
         
         return hierarchy
     
-    def _generate_dependency_analysis(self, graph: Graph) -> Dict[str, Any]:
+    def _generate_dependency_analysis(self, graph: Graph, scan: Optional[NodeScan] = None) -> Dict[str, Any]:
         """Generate dependency analysis."""
-        dependency_edges = [e for e in graph.edges if e.type in [EdgeType.IMPORTS, EdgeType.CALLS, EdgeType.DEPENDS]]
+        if scan is None:
+            scan = self._scan_nodes(graph)
+        edges_by_type = scan.edges_by_type
+        
+        def dep_infos(edge_type: EdgeType) -> List[Dict[str, Any]]:
+            return [
+                {
+                    'from': edge.from_node,
+                    'to': edge.to_node,
+                    'type': edge_type.value,
+                    'metadata': edge.metadata
+                }
+                for edge in edges_by_type.get(edge_type, [])
+            ]
         
-        dependencies = {
-            'import_dependencies': [],
-            'function_calls': [],
-            'general_dependencies': [],
+        return {
+            'import_dependencies': dep_infos(EdgeType.IMPORTS),
+            'function_calls': dep_infos(EdgeType.CALLS),
+            'general_dependencies': dep_infos(EdgeType.DEPENDS),
             'circular_dependencies': self._detect_circular_dependencies(graph)
         }
-        
-        for edge in dependency_edges:
-            dep_info = {
-                'from': edge.from_node,
-                'to': edge.to_node,
-                'type': edge.type.value,
-                'metadata': edge.metadata
-            }
-            
-            if edge.type == EdgeType.IMPORTS:
-                dependencies['import_dependencies'].append(dep_info)
-            elif edge.type == EdgeType.CALLS:
-                dependencies['function_calls'].append(dep_info)
-            else:
-                dependencies['general_dependencies'].append(dep_info)
-        
-        return dependencies
     
-    def _generate_complexity_analysis(self, graph: Graph) -> Dict[str, Any]:
+    def _generate_complexity_analysis(self, graph: Graph, scan: Optional[NodeScan] = None) -> Dict[str, Any]:
         """Generate complexity analysis."""
+        if scan is None:
+            scan = self._scan_nodes(graph)
+        
         complexity_data = {
-            'by_node_type': {},
-            'by_level': {'BUSINESS': [], 'SYSTEM': [], 'IMPLEMENTATION': []},
+            'by_node_type': scan.by_node_type,
+            'by_level': scan.by_level,
             'most_complex_nodes': [],
             'complexity_trends': {}
         }
         
-        # Analyze by node type
-        for node in graph.nodes:
-            node_type = node.type.value
-            if node_type not in complexity_data['by_node_type']:
-                complexity_data['by_node_type'][node_type] = []
-            
-            complexity_info = {
-                'id': node.id,
-                'name': node.name,
-                'complexity': node.metadata.get('complexity', '').value if node.metadata and 'complexity' in node.metadata else 'unknown',
-                'file_count': len(node.files),
-                'function_count': len(node.functions),
-                'class_count': len(node.classes)
-            }
-            
-            complexity_data['by_node_type'][node_type].append(complexity_info)
-            
-            # By level
-            level = node.level.value
-            complexity_data['by_level'][level].append(complexity_info)
-        
         # Find most complex nodes
-        all_nodes_with_complexity = []
-        for node in graph.nodes:
-            if node.metadata and hasattr(node.metadata, 'complexity') and node.metadata.complexity:
-                complexity_score = {'low': 1, 'medium': 2, 'high': 3}.get(node.metadata.complexity.value, 0)
-                all_nodes_with_complexity.append((node, complexity_score))
-        
-        most_complex = sorted(all_nodes_with_complexity, key=lambda x: x[1], reverse=True)[:5]
+        most_complex = sorted(scan.complexity_scored, key=lambda x: x[1], reverse=True)[:5]
         complexity_data['most_complex_nodes'] = [
             {
                 'id': node.id,
                 'name': node.name,
-                'complexity': node.metadata.complexity.value if hasattr(node.metadata, 'complexity') and node.metadata.complexity else 'unknown',
+                'complexity': node.metadata.complexity.value,
                 'type': node.type.value,
                 'level': node.level.value
             }
@@ -366,14 +586,59 @@ class EnhancedExporter:
         return complexity_data
     
     def _detect_circular_dependencies(self, graph: Graph) -> List[List[str]]:
-        """Detect circular dependencies in the graph."""
-        # Simple circular dependency detection
-        # In a full implementation, this would use a more sophisticated algorithm
+        """Detect circular dependencies as strongly connected components of the dependency edges."""
+        adjacency: Dict[str, List[str]] = {}
+        self_loops = set()
+        for edge in graph.edges:
+            if edge.type in _DEPENDENCY_EDGE_TYPES:
+                adjacency.setdefault(edge.from_node, []).append(edge.to_node)
+                adjacency.setdefault(edge.to_node, [])
+                if edge.from_node == edge.to_node:
+                    self_loops.add(edge.from_node)
+        
+        # Iterative Tarjan's algorithm so deep dependency chains cannot hit the recursion limit
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack = set()
+        stack: List[str] = []
         circular_deps = []
         
-        # This is a simplified implementation
-        # For now, we'll return an empty list
-        # A proper implementation would use DFS to detect cycles
+        for root in adjacency:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(adjacency[root]))]
+            
+            while work:
+                node, successors = work[-1]
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = lowlink[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(adjacency[successor])))
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[successor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        # Only multi-node components and self-loops are real cycles
+                        if len(component) > 1 or node in self_loops:
+                            component.reverse()
+                            circular_deps.append(component)
         
         return circular_deps
     
@@ -384,74 +649,51 @@ class EnhancedExporter:
             'has_parent': bool(node.parent),
             'has_children': bool(node.children),
             'child_count': len(node.children),
-            'file_diversity': len(set(Path(f).suffix for f in node.files)) if node.files else 0
+            'file_diversity': len({_file_suffix(f) for f in node.files}) if node.files else 0
         }
         
         if node.metadata and 'complexity' in node.metadata:
-            enriched['complexity_score'] = {'low': 1, 'medium': 2, 'high': 3}.get(node.metadata['complexity'].value, 0)
+            enriched['complexity_score'] = _COMPLEXITY_SCORES.get(node.metadata['complexity'].value, 0)
         
         return enriched
     
     def _enrich_edge_metadata(self, edge: GraphEdge) -> Dict[str, Any]:
         """Enrich edge metadata with additional analysis."""
-        enriched = {
-            'edge_strength': self._calculate_edge_strength(edge),
-            'is_hierarchical': edge.type == EdgeType.CONTAINS,
-            'is_dependency': edge.type in [EdgeType.IMPORTS, EdgeType.CALLS, EdgeType.DEPENDS]
+        edge_strength, is_hierarchical, is_dependency = _EDGE_INFO.get(edge.type, _DEFAULT_EDGE_INFO)
+        return {
+            'edge_strength': edge_strength,
+            'is_hierarchical': is_hierarchical,
+            'is_dependency': is_dependency
         }
-        
-        return enriched
-    
-    def _calculate_edge_strength(self, edge: GraphEdge) -> str:
-        """Calculate the strength of an edge relationship."""
-        if edge.type == EdgeType.CONTAINS:
-            return 'strong'
-        elif edge.type == EdgeType.INHERITS:
-            return 'strong'
-        elif edge.type == EdgeType.IMPORTS:
-            return 'medium'
-        elif edge.type == EdgeType.CALLS:
-            return 'weak'
-        else:
-            return 'medium'
     
     def generate_export_report(self, export_results: Dict[str, str]) -> str:
         """Generate a summary report of the export process."""
+        successful_lines = []
+        failed_lines = []
+        for format_type, result in export_results.items():
+            if format_type.endswith('_error'):
+                failed_lines.append(f"- {format_type.replace('_error', '')}: {result}")
+            else:
+                successful_lines.append(f"- {format_type}: {result}")
+        
         report_lines = [
             "# AutoGraph Export Report",
             f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             "",
             "## Export Summary",
             f"Total formats attempted: {len(export_results)}",
+            "",
+            f"Successful exports: {len(successful_lines)}",
+            f"Failed exports: {len(failed_lines)}",
             ""
         ]
         
-        successful_exports = [k for k in export_results.keys() if not k.endswith('_error')]
-        failed_exports = [k for k in export_results.keys() if k.endswith('_error')]
+        if successful_lines:
+            report_lines += ["## Successful Exports", *successful_lines, ""]
         
-        report_lines.extend([
-            f"Successful exports: {len(successful_exports)}",
-            f"Failed exports: {len(failed_exports)}",
-            ""
-        ])
-        
-        if successful_exports:
-            report_lines.append("## Successful Exports")
-            for format_type in successful_exports:
-                report_lines.append(f"- {format_type}: {export_results[format_type]}")
-            report_lines.append("")
-        
-        if failed_exports:
-            report_lines.append("## Failed Exports")
-            for format_type in failed_exports:
-                original_format = format_type.replace('_error', '')
-                report_lines.append(f"- {original_format}: {export_results[format_type]}")
-            report_lines.append("")
-        
-        report_lines.append("## Next Steps")
-        report_lines.append("1. Open HTML file in a web browser for interactive visualization")
-        report_lines.append("2. Use DOT file with Graphviz for static diagrams")
-        report_lines.append("3. Import JSON/YAML files into other tools for further analysis")
-        report_lines.append("4. Use CSV file for spreadsheet analysis")
+        if failed_lines:
+            report_lines += ["## Failed Exports", *failed_lines, ""]
+        
+        report_lines += _EXPORT_REPORT_NEXT_STEPS
         
         return "\n".join(report_lines) 
\ No newline at end of file
@@ -3,7 +3,13 @@ Enhanced graph builder for AutoGraph Phase 2.
 Integrates semantic analysis and relationship mapping for better graph construction.
 """
 
-from typing import Dict, List, Optional, Any
+import re
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 from pathlib import Path
 from datetime import datetime
 from ..utils.logger import get_logger
@@ -13,12 +19,88 @@ from ..models.schemas import (
     ComplexityLevel, TechnicalDepth, RiskLevel, NodeMetadata, PMMetadata, 
     EnhancedMetadata, PMMetrics, GraphStatistics
 )
-from ..models.graph_models import GraphBuilder
+from ..models.graph_models import FileInfo, GraphBuilder
 from ..llm_integration.semantic_analyzer import SemanticAnalyzer
 from ..llm_integration.relationship_mapper import RelationshipMapper
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent LLM requests during semantic analysis
+SEMANTIC_ANALYSIS_MAX_WORKERS = 16
+
+# Files sent to the LLM in a single semantic analysis request
+SEMANTIC_ANALYSIS_BATCH_SIZE = 10
+
+# Path segments of non-core sources (tests/docs/examples/static) skipped during analysis
+_NON_CORE_PATH_RE = re.compile(r'/(?:tests?|docs|examples?|static|assets)/', re.IGNORECASE)
+
+# Function-name buckets for _group_functions_by_purpose, checked in order (first match wins)
+_FUNCTION_PURPOSE_PATTERNS = (
+    ('Data Processing', re.compile('process|transform|convert|parse|format')),
+    ('Validation', re.compile('validate|check|verify|test|assert')),
+    ('Utility', re.compile('util|helper|format|clean|normalize')),
+    ('Business Logic', re.compile('calculate|compute|analyze|generate|create')),
+    ('Configuration', re.compile('config|setup|init|load|save')),
+)
+
+# Node fill colors by type; unknown types fall back to a light grey
+_NODE_COLORS = {
+    NodeType.MODULE: '#9013FE',
+    NodeType.API: '#4A90E2',
+    NodeType.SERVICE: '#D0021B',
+    NodeType.DATABASE: '#FF9800',
+    NodeType.CLIENT: '#4CAF50',
+    NodeType.APPLICATION: '#2196F3',
+    NodeType.COMPONENT: '#9C27B0',
+    NodeType.FUNCTION: '#607D8B',
+    NodeType.CLASS: '#795548',
+    NodeType.FUNCTION_GROUP: '#FF5722',
+    NodeType.UTILITY: '#00BCD4',
+    NodeType.CONTROLLER: '#8BC34A',
+    NodeType.MODEL: '#FFC107',
+    NodeType.TEST: '#E91E63'
+}
+
+# Complexity weights used for the PM completion estimate; unknown values weigh 1
+_COMPLEXITY_WEIGHTS = {"low": 1, "medium": 2, "high": 3}
+
+# Stands in for a file's FileInfo when it is missing from the parsing result
+_MISSING_FILE_INFO = FileInfo(path='', size=0, line_count=0, language='python',
+                              category='backend', last_modified=0.0)
+
+
+def _is_non_core_path(file_path: Any) -> bool:
+    """Check whether a file lives under a tests/docs/examples/static/assets directory."""
+    return _NON_CORE_PATH_RE.search(str(file_path).replace('\\', '/')) is not None
+
+
+def build_file_to_hld_index(hld_nodes: Dict[str, GraphNode]) -> Dict[str, GraphNode]:
+    """Map each file to the first BUSINESS node that contains it."""
+    file_to_hld = {}
+    for hld_node in hld_nodes.values():
+        for file_path in hld_node.files:
+            file_to_hld.setdefault(file_path, hld_node)
+    return file_to_hld
+
+
+# Dunder methods and accessor-style prefixes too low-level to become implementation nodes;
+# matched anywhere in the lower-cased name
+_LOW_LEVEL_NAME_RE = re.compile('|'.join(re.escape(pattern) for pattern in (
+    '__init__', '__str__', '__repr__', '__eq__', '__hash__',
+    '__getitem__', '__setitem__', '__delitem__', '__len__',
+    '__contains__', '__iter__', '__next__', '__enter__', '__exit__',
+    '__call__', '__getattr__', '__setattr__', '__delattr__',
+    '__getattribute__', '__new__', '__del__', '__slots__',
+    'get_', 'set_', 'is_', 'has_', 'add_', 'remove_', 'clear_',
+    'update_', 'reset_', 'init_', 'cleanup_', 'validate_'
+)))
+
+
+@lru_cache(maxsize=4096)
+def _is_low_level_name(name: str) -> bool:
+    """Check whether a class or function name matches a low-level pattern."""
+    return _LOW_LEVEL_NAME_RE.search(name.lower()) is not None
+
 
 class EnhancedGraphBuilder:
     """Enhanced graph builder with semantic analysis and relationship mapping."""
@@ -29,6 +111,8 @@ class EnhancedGraphBuilder:
         self.graph_builder = GraphBuilder()
         self.semantic_results: Dict[str, Dict[str, Any]] = {}
         self.relationship_results: Dict[str, List[Dict[str, Any]]] = {}
+        # (stem, parent directory name) per file path, shared by the node and clustering phases
+        self._path_cache: Dict[str, Tuple[str, str]] = {}
     
     def build_enhanced_graph(self, codebase_path: str, parsing_result: Dict[str, Any]) -> Graph:
         """Build an enhanced graph with semantic analysis and relationship mapping."""
@@ -49,39 +133,76 @@ class EnhancedGraphBuilder:
         logger.info(f"Enhanced graph built: {len(graph.nodes)} nodes, {len(graph.edges)} edges")
         return graph
     
+    def _path_parts(self, file_path: str) -> Tuple[str, str]:
+        """Get the (stem, parent directory name) of a file path, computed once per path."""
+        parts = self._path_cache.get(file_path)
+        if parts is None:
+            path = Path(file_path)
+            parts = self._path_cache[file_path] = (path.stem, path.parent.name)
+        return parts
+    
     def _perform_semantic_analysis(self, parsing_result: Dict[str, Any]) -> None:
         """Perform semantic analysis on all parsed files."""
         logger.info("Performing semantic analysis...")
         
+        tasks = []
         for file_path, file_data in parsing_result['parsed_files'].items():
             # Skip non-core sources (tests/docs/examples/static)
             try:
                 file_info = file_data.get('file_info')
-                p = str(file_path).replace('\\','/').lower()
-                if any(seg in p for seg in ['/tests/', '/test/', '/docs/', '/examples/', '/example/', '/static/', '/assets/']):
+                if _is_non_core_path(file_path):
                     continue
                 if file_info and hasattr(file_info, 'category') and file_info.category not in ('backend',):
                     continue
             except Exception:
                 pass
-            try:
-                # Get file content from parsing result
-                file_content = file_data.get('file_content', '')
-                
-                # Get symbols for analysis
-                symbols = file_data.get('symbols', {})
-                
-                # Perform semantic analysis
-                semantic_result = self.semantic_analyzer.analyze_file_semantics(
-                    file_path, symbols, file_content
-                )
-                
-                self.semantic_results[file_path] = semantic_result
-                
-            except Exception as e:
-                logger.warning(f"Failed to analyze semantics for {file_path}: {e}")
-                # Use default semantic analysis
-                self.semantic_results[file_path] = self._get_default_semantic_analysis(file_path)
+            tasks.append((file_path, file_data))
+        
+        # LLM-backed analysis is network-bound, so send files in batches and fan the
+        # batches out across threads; the rule-based fallback is cheap enough to run inline
+        if len(tasks) > 1 and getattr(self.semantic_analyzer.llm_client, 'client', None) is not None:
+            batches = [tasks[i:i + SEMANTIC_ANALYSIS_BATCH_SIZE]
+                       for i in range(0, len(tasks), SEMANTIC_ANALYSIS_BATCH_SIZE)]
+            max_workers = min(SEMANTIC_ANALYSIS_MAX_WORKERS, len(batches))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(chain.from_iterable(executor.map(self._analyze_file_semantics_batch, batches)))
+        else:
+            results = map(self._analyze_file_semantics, tasks)
+        
+        for (file_path, _), semantic_result in zip(tasks, results):
+            self.semantic_results[file_path] = semantic_result
+    
+    def _analyze_file_semantics_batch(self, tasks: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Analyze a batch of (file_path, file_data) items together, falling back to per-file analysis on failure."""
+        try:
+            batch_results = self.semantic_analyzer.analyze_files_semantics_batch([
+                (file_path, file_data.get('symbols', {}), file_data.get('file_content', ''))
+                for file_path, file_data in tasks
+            ])
+            return [batch_results[file_path] for file_path, _ in tasks]
+        except Exception as e:
+            logger.warning(f"Batch semantic analysis failed for {len(tasks)} files: {e}")
+            return [self._analyze_file_semantics(task) for task in tasks]
+    
+    def _analyze_file_semantics(self, task: Tuple[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Analyze one (file_path, file_data) item, falling back to the default analysis on failure."""
+        file_path, file_data = task
+        try:
+            # Get file content from parsing result
+            file_content = file_data.get('file_content', '')
+            
+            # Get symbols for analysis
+            symbols = file_data.get('symbols', {})
+            
+            # Perform semantic analysis
+            return self.semantic_analyzer.analyze_file_semantics(
+                file_path, symbols, file_content
+            )
+            
+        except Exception as e:
+            logger.warning(f"Failed to analyze semantics for {file_path}: {e}")
+            # Use default semantic analysis
+            return self._get_default_semantic_analysis(file_path)
     
     def _map_relationships(self, parsing_result: Dict[str, Any]) -> None:
         """Map relationships between components."""
@@ -117,7 +238,7 @@ class EnhancedGraphBuilder:
         # Build the graph
         graph = Graph(
             metadata=metadata,
-            nodes=list(hld_nodes.values()) + list(system_nodes.values()) + list(lld_nodes.values()),
+            nodes=list(chain(hld_nodes.values(), system_nodes.values(), lld_nodes.values())),
             edges=edges
         )
         
@@ -138,32 +259,47 @@ class EnhancedGraphBuilder:
 
         # Build a file-level import graph (core files only)
         file_imports = {}
-        file_paths = [fp for fp, fd in parsing_result['parsed_files'].items()
-                      if not any(seg in str(fp).replace('\\','/').lower() for seg in ['/tests/','/test/','/docs/','/examples/','/example/','/static/','/assets/'])]
-        normalized = {fp: Path(fp) for fp in file_paths}
+        file_paths = [fp for fp in parsing_result['parsed_files'] if not _is_non_core_path(fp)]
+
+        # Simple heuristic to link imports to files: a file is imported when its stem
+        # occurs within any dotted part of an import. Index files by stem so each
+        # part is resolved with substring lookups instead of a scan over every file.
+        stem_to_files: Dict[str, List[str]] = defaultdict(list)
+        for fp in file_paths:
+            stem_to_files[self._path_parts(fp)[0]].append(fp)
+        max_stem_len = max(map(len, stem_to_files), default=0)
+        part_matches: Dict[str, Set[str]] = {}
 
-        def matches_import(target_path: Path, imp: str) -> bool:
-            # Simple heuristics to link imports to files
-            stem = target_path.stem
-            parts = imp.replace(' ', '').replace(':', '').split('.')
-            return stem in parts or any(stem in p for p in parts)
+        def files_matching_part(part: str) -> Set[str]:
+            matches = part_matches.get(part)
+            if matches is None:
+                matches = set()
+                for start in range(len(part)):
+                    for end in range(start + 1, min(len(part), start + max_stem_len) + 1):
+                        files = stem_to_files.get(part[start:end])
+                        if files:
+                            matches.update(files)
+                part_matches[part] = matches
+            return matches
 
         for fp, data in parsing_result['parsed_files'].items():
             imps = data.get('imports', []) or []
+            if not imps:
+                file_imports[fp] = []
+                continue
             targets = set()
-            for other in file_paths:
-                if other == fp:
-                    continue
-                if any(matches_import(normalized[other], imp) for imp in imps):
-                    targets.add(other)
-            file_imports[fp] = list(targets)
+            for imp in imps:
+                for part in imp.replace(' ', '').replace(':', '').split('.'):
+                    targets |= files_matching_part(part)
+            targets.discard(fp)
+            file_imports[fp] = sorted(targets)
 
         # Group by package submodule under src/<package>/<group>/
         clusters: List[List[str]] = []
         pkg_groups: Dict[str, List[str]] = {}
         for fp in file_paths:
             lower = str(fp).replace('\\','/')
-            key = Path(fp).parent.name
+            key = self._path_parts(fp)[1]
             if '/src/' in lower:
                 rel = lower.split('/src/',1)[1]
                 parts = rel.split('/')
@@ -179,34 +315,44 @@ class EnhancedGraphBuilder:
         system_edges: List[GraphEdge] = []
 
         # Helper to find business parent by overlap of files
+        business_file_sets = [(bn, frozenset(bn.files)) for bn in business_nodes.values()]
+
         def find_business_parent(files: List[str]) -> Optional[GraphNode]:
             best = None
             best_overlap = 0
             file_set = set(files)
-            for bn in business_nodes.values():
-                overlap = len(file_set.intersection(set(bn.files)))
+            for bn, bn_files in business_file_sets:
+                if file_set.isdisjoint(bn_files):
+                    continue
+                overlap = len(file_set & bn_files)
                 if overlap > best_overlap:
                     best_overlap = overlap
                     best = bn
             return best
 
         # Map impl nodes to their primary file
-        impl_by_file: Dict[str, List[GraphNode]] = {}
+        impl_by_file: Dict[str, List[GraphNode]] = defaultdict(list)
         for node in impl_nodes.values():
             for f in node.files:
-                impl_by_file.setdefault(f, []).append(node)
+                impl_by_file[f].append(node)
+
+        # Map file to system cluster id, filled in as the SYSTEM nodes are created
+        file_to_cluster: Dict[str, str] = {}
 
-        # Create nodes and containment edges
+        # Create nodes and containment edges; bind the enum members used per node and edge once
+        system_color = self._get_node_color(NodeType.SERVICE)
+        service, system_level = NodeType.SERVICE, NodeLevel.SYSTEM
+        contains, depends_on = EdgeType.CONTAINS, EdgeType.DEPENDS_ON
         for idx, files in enumerate(clusters):
-            dir_names = [Path(f).parent.name for f in files]
-            common_dir = max(set(dir_names), key=dir_names.count) if dir_names else f"cluster_{idx+1}"
+            dir_names = [self._path_parts(f)[1] for f in files]
+            common_dir = Counter(dir_names).most_common(1)[0][0] if dir_names else f"cluster_{idx+1}"
             pretty_name = common_dir.replace('_',' ').title()
             node_id = f"system_{common_dir.lower()}_{idx+1}"
             system_node = GraphNode(
                 id=node_id,
                 name=f"{pretty_name}",
-                type=NodeType.SERVICE,
-                level=NodeLevel.SYSTEM,
+                type=service,
+                level=system_level,
                 files=files,
                 metadata=NodeMetadata(
                     purpose=f"Cluster of {len(files)} files under {common_dir}",
@@ -217,7 +363,7 @@ class EnhancedGraphBuilder:
                     language='python',
                     category='cluster',
                     technical_depth=TechnicalDepth.SYSTEM,
-                    color=self._get_node_color(NodeType.SERVICE),
+                    color=system_color,
                     size=len(files) * 8
                 )
             )
@@ -229,7 +375,7 @@ class EnhancedGraphBuilder:
                 system_edges.append(GraphEdge(
                     from_node=parent_business.id,
                     to_node=node_id,
-                    type=EdgeType.CONTAINS,
+                    type=contains,
                     metadata={'relationship_type': 'hierarchy'}
                 ))
                 system_node.parent = parent_business.id
@@ -237,40 +383,34 @@ class EnhancedGraphBuilder:
 
             # Attach implementation nodes contained in this cluster
             for f in files:
+                file_to_cluster[f] = node_id
                 for impl in impl_by_file.get(f, []):
                     system_edges.append(GraphEdge(
                         from_node=node_id,
                         to_node=impl.id,
-                        type=EdgeType.CONTAINS,
+                        type=contains,
                         metadata={'relationship_type': 'hierarchy'}
                     ))
                     impl.parent = node_id
                     system_node.children.append(impl.id)
 
         # Collapse file-level imports into system-level depends_on edges
-        # Map file to system cluster id
-        file_to_cluster: Dict[str, str] = {}
-        for sid, snode in system_nodes.items():
-            for f in snode.files:
-                file_to_cluster[f] = sid
-
-        seen_pairs = set()
-        for src, tgts in file_imports.items():
-            src_cluster = file_to_cluster.get(src)
-            for tgt in tgts:
-                tgt_cluster = file_to_cluster.get(tgt)
-                if not src_cluster or not tgt_cluster or src_cluster == tgt_cluster:
-                    continue
-                key = (src_cluster, tgt_cluster)
-                if key in seen_pairs:
-                    continue
-                seen_pairs.add(key)
-                system_edges.append(GraphEdge(
-                    from_node=src_cluster,
-                    to_node=tgt_cluster,
-                    type=EdgeType.DEPENDS_ON,
-                    metadata={'relationship_type': 'depends_on'}
-                ))
+        # dict.fromkeys dedupes the cluster pairs while keeping first-seen order
+        cluster_pairs = dict.fromkeys(
+            (file_to_cluster[src], file_to_cluster[tgt])
+            for src, tgts in file_imports.items() if src in file_to_cluster
+            for tgt in tgts if tgt in file_to_cluster
+        )
+        system_edges.extend(
+            GraphEdge(
+                from_node=src_cluster,
+                to_node=tgt_cluster,
+                type=depends_on,
+                metadata={'relationship_type': 'depends_on'}
+            )
+            for src_cluster, tgt_cluster in cluster_pairs
+            if src_cluster != tgt_cluster
+        )
 
         return system_nodes, system_edges
     
@@ -288,7 +428,8 @@ class EnhancedGraphBuilder:
         
         # Calculate enhanced statistics
         total_files = stats['total_files']
-        total_lines = sum(file_data['file_info'].line_count for file_data in parsing_result['parsed_files'].values())
+        file_infos = map(itemgetter('file_info'), parsing_result['parsed_files'].values())
+        total_lines = sum(map(attrgetter('line_count'), file_infos))
         
         # Create graph statistics
         graph_stats = GraphStatistics(
@@ -354,12 +495,9 @@ class EnhancedGraphBuilder:
         """Create enhanced Implementation nodes with semantic analysis - grouped by logical containers."""
         lld_nodes = {}
         
-        # Track logical groupings
-        logical_groups = {}
-        
         for file_path, file_data in parsing_result['parsed_files'].items():
             semantic_result = self.semantic_results.get(file_path, {})
-            file_stem = Path(file_path).stem
+            file_stem = self._path_parts(file_path)[0]
             
             # Group by classes first (classes are logical containers)
             for class_name in file_data['classes']:
@@ -385,17 +523,12 @@ class EnhancedGraphBuilder:
                         functions=filtered_functions,
                         metadata=self._create_enhanced_class_metadata(class_name, file_path, parsing_result, semantic_result)
                     )
-                    logical_groups[node_id] = {
-                        'type': 'class',
-                        'name': class_name,
-                        'functions': filtered_functions,
-                        'file': file_path
-                    }
             
             # Group standalone functions by their logical purpose
+            class_names_lower = tuple(c.lower() for c in file_data['classes'])
             standalone_functions = [f for f in file_data['functions'] 
                                   if not self._should_skip_low_level_component(f) 
-                                  and not self._is_function_in_class(f, file_data)]
+                                  and not self._is_function_in_class(f.lower(), class_names_lower)]
             
             if standalone_functions:
                 # Group functions by their semantic purpose
@@ -413,29 +546,12 @@ class EnhancedGraphBuilder:
                             functions=group_functions,
                             metadata=self._create_enhanced_function_group_metadata(group_name, group_functions, file_path, parsing_result, semantic_result)
                         )
-                        logical_groups[node_id] = {
-                            'type': 'function_group',
-                            'name': group_name,
-                            'functions': group_functions,
-                            'file': file_path
-                        }
         
         return lld_nodes
     
     def _should_skip_low_level_component(self, name: str) -> bool:
         """Check if a component should be skipped (too low-level)."""
-        low_level_patterns = [
-            '__init__', '__str__', '__repr__', '__eq__', '__hash__',
-            '__getitem__', '__setitem__', '__delitem__', '__len__',
-            '__contains__', '__iter__', '__next__', '__enter__', '__exit__',
-            '__call__', '__getattr__', '__setattr__', '__delattr__',
-            '__getattribute__', '__new__', '__del__', '__slots__',
-            'get_', 'set_', 'is_', 'has_', 'add_', 'remove_', 'clear_',
-            'update_', 'reset_', 'init_', 'cleanup_', 'validate_'
-        ]
-        
-        name_lower = name.lower()
-        return any(pattern in name_lower for pattern in low_level_patterns)
+        return _is_low_level_name(name)
     
     def _get_class_functions(self, class_name: str, file_data: Dict[str, Any]) -> List[str]:
         """Get all functions that belong to a specific class."""
@@ -444,11 +560,11 @@ class EnhancedGraphBuilder:
         # For now, we'll return all functions and let the semantic analysis help
         return file_data.get('functions', [])
     
-    def _is_function_in_class(self, function_name: str, file_data: Dict[str, Any]) -> bool:
-        """Check if a function is likely part of a class."""
+    def _is_function_in_class(self, function_name_lower: str, class_names_lower: Tuple[str, ...]) -> bool:
+        """Check if a function is likely part of a class, given lower-cased function and class names."""
         # This is a simplified check - in reality, you'd need AST analysis
         # For now, we'll assume functions with 'self' parameter or class-like naming are in classes
-        return any(class_name.lower() in function_name.lower() for class_name in file_data.get('classes', []))
+        return any(class_name in function_name_lower for class_name in class_names_lower)
     
     def _group_functions_by_purpose(self, functions: List[str], file_path: str, semantic_result: Dict[str, Any]) -> Dict[str, List[str]]:
         """Group standalone functions by their logical purpose."""
@@ -465,16 +581,10 @@ class EnhancedGraphBuilder:
             func_lower = func_name.lower()
             
             # Categorize based on function name patterns
-            if any(word in func_lower for word in ['process', 'transform', 'convert', 'parse', 'format']):
-                groups['Data Processing'].append(func_name)
-            elif any(word in func_lower for word in ['validate', 'check', 'verify', 'test', 'assert']):
-                groups['Validation'].append(func_name)
-            elif any(word in func_lower for word in ['util', 'helper', 'format', 'clean', 'normalize']):
-                groups['Utility'].append(func_name)
-            elif any(word in func_lower for word in ['calculate', 'compute', 'analyze', 'generate', 'create']):
-                groups['Business Logic'].append(func_name)
-            elif any(word in func_lower for word in ['config', 'setup', 'init', 'load', 'save']):
-                groups['Configuration'].append(func_name)
+            for group_name, pattern in _FUNCTION_PURPOSE_PATTERNS:
+                if pattern.search(func_lower):
+                    groups[group_name].append(func_name)
+                    break
             else:
                 groups['Other'].append(func_name)
         
@@ -501,24 +611,25 @@ class EnhancedGraphBuilder:
                                    lld_nodes: Dict[str, GraphNode]) -> List[GraphEdge]:
         """Create enhanced graph edges with relationship mapping."""
         edges = []
+        contains = EdgeType.CONTAINS
+        file_to_hld = build_file_to_hld_index(hld_nodes)
         
         # Create containment edges (BUSINESS contains IMPLEMENTATION)
         for lld_node in lld_nodes.values():
             for file_path in lld_node.files:
-                parent_hld = self._find_parent_hld_node(file_path, hld_nodes)
+                parent_hld = file_to_hld.get(file_path)
                 if parent_hld:
                     edges.append(GraphEdge(
                         from_node=parent_hld.id,
                         to_node=lld_node.id,
-                        type=EdgeType.CONTAINS,
+                        type=contains,
                         metadata={'relationship_type': 'hierarchy'}
                     ))
                     lld_node.parent = parent_hld.id
                     parent_hld.children.append(lld_node.id)
         
         # Create relationship edges based on semantic analysis
-        relationship_edges = self._create_relationship_edges(parsing_result, lld_nodes)
-        edges.extend(relationship_edges)
+        edges.extend(self._iter_relationship_edges(parsing_result, lld_nodes))
         
         return edges
     
@@ -540,8 +651,7 @@ class EnhancedGraphBuilder:
             try:
                 file_info = file_data.get('file_info')
                 p = str(file_path).replace('\\','/')
-                pl = p.lower()
-                if any(seg in pl for seg in ['/tests/','/test/','/docs/','/examples/','/example/','/static/','/assets/']):
+                if _is_non_core_path(file_path):
                     continue
                 if file_info and hasattr(file_info, 'category') and file_info.category not in ('backend',):
                     continue
@@ -589,7 +699,7 @@ class EnhancedGraphBuilder:
             component_types.append(semantic_result.get('component_type', NodeType.MODULE))
         
         # Determine dominant characteristics
-        dominant_type = max(set(component_types), key=component_types.count) if component_types else NodeType.MODULE
+        dominant_type = Counter(component_types).most_common(1)[0][0] if component_types else NodeType.MODULE
         avg_complexity = self._calculate_average_complexity(complexities)
         
         return {
@@ -604,10 +714,12 @@ class EnhancedGraphBuilder:
         """Create enhanced metadata for a node with semantic analysis."""
         total_lines = 0
         total_size = 0
+        parsed_files = parsing_result['parsed_files']
         
         for file_path in files:
-            if file_path in parsing_result['parsed_files']:
-                file_info = parsing_result['parsed_files'][file_path]['file_info']
+            file_data = parsed_files.get(file_path)
+            if file_data is not None:
+                file_info = file_data['file_info']
                 total_lines += file_info.line_count
                 total_size += file_info.size
         
@@ -640,21 +752,16 @@ class EnhancedGraphBuilder:
                                          semantic_result: Dict[str, Any]) -> NodeMetadata:
         """Create enhanced metadata for a function with semantic analysis."""
         file_data = parsing_result['parsed_files'].get(file_path, {})
-        file_info = file_data.get('file_info')
-        
-        # Get relationship summary for this file
-        relationship_summary = self.relationship_mapper.get_relationship_summary(
-            file_path, self.relationship_results
-        )
+        file_info = file_data.get('file_info') or _MISSING_FILE_INFO
         
         return NodeMetadata(
             purpose=f"Function: {func_name}",
             complexity=semantic_result.get('complexity', ComplexityLevel.LOW),
             dependencies=file_data.get('imports', []),
-            line_count=file_info.line_count if file_info else 0,
-            file_size=file_info.size if file_info else 0,
-            language=file_info.language if file_info else 'python',
-            category=file_info.category if file_info else 'backend',
+            line_count=file_info.line_count,
+            file_size=file_info.size,
+            language=file_info.language,
+            category=file_info.category,
             technical_depth=TechnicalDepth.IMPLEMENTATION,
             color=self._get_node_color(NodeType.FUNCTION),
             size=5,  # Small size for functions
@@ -670,21 +777,16 @@ class EnhancedGraphBuilder:
                                       semantic_result: Dict[str, Any]) -> NodeMetadata:
         """Create enhanced metadata for a class with semantic analysis."""
         file_data = parsing_result['parsed_files'].get(file_path, {})
-        file_info = file_data.get('file_info')
-        
-        # Get relationship summary for this file
-        relationship_summary = self.relationship_mapper.get_relationship_summary(
-            file_path, self.relationship_results
-        )
+        file_info = file_data.get('file_info') or _MISSING_FILE_INFO
         
         return NodeMetadata(
             purpose=f"Class: {class_name}",
             complexity=semantic_result.get('complexity', ComplexityLevel.MEDIUM),
             dependencies=file_data.get('imports', []),
-            line_count=file_info.line_count if file_info else 0,
-            file_size=file_info.size if file_info else 0,
-            language=file_info.language if file_info else 'python',
-            category=file_info.category if file_info else 'backend',
+            line_count=file_info.line_count,
+            file_size=file_info.size,
+            language=file_info.language,
+            category=file_info.category,
             technical_depth=TechnicalDepth.IMPLEMENTATION,
             color=self._get_node_color(NodeType.CLASS),
             size=8,  # Medium size for classes
@@ -695,54 +797,47 @@ class EnhancedGraphBuilder:
             agent_context=None
         )
     
-    def _find_parent_hld_node(self, file_path: str, hld_nodes: Dict[str, GraphNode]) -> Optional[GraphNode]:
-        """Find the BUSINESS node that contains a given file."""
-        for hld_node in hld_nodes.values():
-            if file_path in hld_node.files:
-                return hld_node
-        return None
-    
-    def _create_relationship_edges(self, parsing_result: Dict[str, Any], 
-                                 lld_nodes: Dict[str, GraphNode]) -> List[GraphEdge]:
-        """Create edges based on relationship mapping."""
-        edges = []
+    def _iter_relationship_edges(self, parsing_result: Dict[str, Any], 
+                                 lld_nodes: Dict[str, GraphNode]) -> Iterator[GraphEdge]:
+        """Yield edges based on relationship mapping."""
+        # Index LLD node ids by file so sources and targets are hash lookups
+        file_to_node_ids: Dict[str, List[str]] = defaultdict(list)
+        for node in lld_nodes.values():
+            for f in node.files:
+                file_to_node_ids[f].append(node.id)
         
         for file_path, relationships in self.relationship_results.items():
+            source_ids = file_to_node_ids.get(file_path)
+            if not source_ids:
+                continue
             for rel in relationships:
                 # Find the corresponding LLD nodes
-                source_nodes = [n for n in lld_nodes.values() if file_path in n.files]
-                target_nodes = [n for n in lld_nodes.values() if rel['target'] in n.files]
+                target_ids = file_to_node_ids.get(rel['target'])
+                if not target_ids:
+                    continue
                 
-                # Create edges between the nodes
-                for source_node in source_nodes:
-                    for target_node in target_nodes:
-                        if source_node.id != target_node.id:
-                            edges.append(GraphEdge(
-                                from_node=source_node.id,
-                                to_node=target_node.id,
-                                type=rel['type'],
-                                metadata={
-                                    'strength': rel['strength'],
-                                    'description': rel['description'],
-                                    'relationship_type': 'semantic'
-                                }
-                            ))
-        
-        return edges
+                # Create edges between the nodes; GraphEdge copies the metadata dict
+                rel_type = rel['type']
+                metadata = {
+                    'strength': rel['strength'],
+                    'description': rel['description'],
+                    'relationship_type': 'semantic'
+                }
+                for source_id in source_ids:
+                    for target_id in target_ids:
+                        if source_id != target_id:
+                            yield GraphEdge(from_node=source_id, to_node=target_id, type=rel_type, metadata=metadata)
     
     def _calculate_average_complexity(self, complexities: List[ComplexityLevel]) -> ComplexityLevel:
         """Calculate average complexity from a list of complexity levels."""
         if not complexities:
             return ComplexityLevel.LOW
         
-        # Convert to numeric values for averaging
-        complexity_values = {
-            ComplexityLevel.LOW: 1,
-            ComplexityLevel.MEDIUM: 2,
-            ComplexityLevel.HIGH: 3
-        }
-        
-        avg_value = sum(complexity_values.get(c, 1) for c in complexities) / len(complexities)
+        # Weights are LOW=1, MEDIUM=2, HIGH=3 and anything else 1, so tally the levels
+        # once and add the extra weight of the MEDIUM and HIGH entries to the count
+        counts = Counter(complexities)
+        total = len(complexities) + counts[ComplexityLevel.MEDIUM] + 2 * counts[ComplexityLevel.HIGH]
+        avg_value = total / len(complexities)
         
         if avg_value >= 2.5:
             return ComplexityLevel.HIGH
@@ -774,25 +869,46 @@ class EnhancedGraphBuilder:
             for issue in validation_issues:
                 logger.warning(f"  - {issue}")
         
-        # Update graph statistics
-        hld_nodes = [node for node in graph.nodes if node.level == NodeLevel.BUSINESS]
-        lld_nodes = [node for node in graph.nodes if node.level == NodeLevel.IMPLEMENTATION]
+        # Tally every node statistic in a single pass
+        business_count = implementation_count = 0
+        system_depth_count = implementation_depth_count = 0
+        high_complexity_count = agent_touched_count = 0
+        total_complexity = 0
+        for node in graph.nodes:
+            level = node.level
+            if level == NodeLevel.BUSINESS:
+                business_count += 1
+            elif level == NodeLevel.IMPLEMENTATION:
+                implementation_count += 1
+            metadata = node.metadata
+            technical_depth = metadata.technical_depth
+            if technical_depth == TechnicalDepth.SYSTEM:
+                system_depth_count += 1
+            elif technical_depth == TechnicalDepth.IMPLEMENTATION:
+                implementation_depth_count += 1
+            complexity = metadata.complexity
+            total_complexity += _COMPLEXITY_WEIGHTS.get(complexity.value, 1)
+            if complexity == ComplexityLevel.HIGH:
+                high_complexity_count += 1
+            if metadata.agent_touched:
+                agent_touched_count += 1
+        node_count = len(graph.nodes)
         
         # Count nodes by technical depth
         technical_depths = {
-            "business": len(hld_nodes),
-            "system": len([n for n in graph.nodes if n.metadata.technical_depth == TechnicalDepth.SYSTEM]),
-            "implementation": len([n for n in graph.nodes if n.metadata.technical_depth == TechnicalDepth.IMPLEMENTATION])
+            "business": business_count,
+            "system": system_depth_count,
+            "implementation": implementation_depth_count
         }
         
         # Update graph statistics
         graph.metadata.statistics = GraphStatistics(
-            total_nodes=len(graph.nodes),
-            hld_nodes=len(hld_nodes),  # legacy
-            lld_nodes=len(lld_nodes),  # legacy
-            business_nodes=len(hld_nodes),
-            system_nodes=len([n for n in graph.nodes if n.metadata.technical_depth == TechnicalDepth.SYSTEM]),
-            implementation_nodes=len(lld_nodes),
+            total_nodes=node_count,
+            hld_nodes=business_count,  # legacy
+            lld_nodes=implementation_count,  # legacy
+            business_nodes=business_count,
+            system_nodes=system_depth_count,
+            implementation_nodes=implementation_count,
             total_edges=len(graph.edges),
             technical_depths=technical_depths
         )
@@ -800,26 +916,20 @@ class EnhancedGraphBuilder:
         # Update PM metrics
         if graph.metadata.pm_metrics:
             # Calculate completion percentage based on node complexity
-            total_complexity = sum(
-                {"low": 1, "medium": 2, "high": 3}.get(node.metadata.complexity.value, 1)
-                for node in graph.nodes
-            )
-            avg_complexity = total_complexity / len(graph.nodes) if graph.nodes else 1
+            avg_complexity = total_complexity / node_count if node_count else 1
             
             # Estimate completion based on complexity and node count
             completion_percentage = min(95.0, max(10.0, 100 - (avg_complexity * 10)))
             
-            # Determine risk level based on complexity and agent usage
-            high_complexity_nodes = [n for n in graph.nodes if n.metadata.complexity == ComplexityLevel.HIGH]
-            agent_touched_nodes = [n for n in graph.nodes if n.metadata.agent_touched]
-            
-            risk_level = RiskLevel.LOW
-            if len(agent_touched_nodes) > 0:
-                risk_level = RiskLevel.MEDIUM
-            if len(high_complexity_nodes) > len(graph.nodes) * 0.3:
-                risk_level = RiskLevel.HIGH
-            if len(agent_touched_nodes) > len(graph.nodes) * 0.2:
+            # Determine risk level based on complexity and agent usage, strongest rule first
+            if agent_touched_count > node_count * 0.2:
                 risk_level = RiskLevel.CRITICAL
+            elif high_complexity_count > node_count * 0.3:
+                risk_level = RiskLevel.HIGH
+            elif agent_touched_count > 0:
+                risk_level = RiskLevel.MEDIUM
+            else:
+                risk_level = RiskLevel.LOW
             
             graph.metadata.pm_metrics.completion_percentage = completion_percentage
             graph.metadata.pm_metrics.risk_level = risk_level
@@ -854,20 +964,4 @@ class EnhancedGraphBuilder:
 
     def _get_node_color(self, node_type: NodeType) -> str:
         """Get color for node based on type."""
-        color_map = {
-            NodeType.MODULE: '#9013FE',
-            NodeType.API: '#4A90E2',
-            NodeType.SERVICE: '#D0021B',
-            NodeType.DATABASE: '#FF9800',
-            NodeType.CLIENT: '#4CAF50',
-            NodeType.APPLICATION: '#2196F3',
-            NodeType.COMPONENT: '#9C27B0',
-            NodeType.FUNCTION: '#607D8B',
-            NodeType.CLASS: '#795548',
-            NodeType.FUNCTION_GROUP: '#FF5722',
-            NodeType.UTILITY: '#00BCD4',
-            NodeType.CONTROLLER: '#8BC34A',
-            NodeType.MODEL: '#FFC107',
-            NodeType.TEST: '#E91E63'
-        }
-        return color_map.get(node_type, '#f0f0f0') 
\ No newline at end of file
+        return _NODE_COLORS.get(node_type, '#f0f0f0') 
\ No newline at end of file
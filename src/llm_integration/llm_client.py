@@ -5,7 +5,7 @@ Handles API calls and response processing.
 
 import json
 import hashlib
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import openai
 from ..config.settings import settings
@@ -47,14 +47,9 @@ class LLMClient:
         cache_file = self.cache_dir / f"{cache_key}.json"
         
         # Check cache first
-        if settings.LLM_CACHE_ENABLED and cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    cached_result = json.load(f)
-                logger.debug(f"Using cached LLM analysis for {file_path}")
-                return cached_result
-            except Exception as e:
-                logger.warning(f"Failed to load cached result: {e}")
+        cached_result = self._load_cached_result(cache_file, file_path)
+        if cached_result is not None:
+            return cached_result
         
         # Prepare prompt
         prompt = self._create_analysis_prompt(file_path, file_content, symbols)
@@ -75,12 +70,7 @@ class LLMClient:
             result = self._parse_llm_response(response.choices[0].message.content)
             
             # Cache result
-            if settings.LLM_CACHE_ENABLED:
-                try:
-                    with open(cache_file, 'w') as f:
-                        json.dump(result, f, indent=2)
-                except Exception as e:
-                    logger.warning(f"Failed to cache result: {e}")
+            self._store_cached_result(cache_file, result)
             
             logger.debug(f"LLM analysis completed for {file_path}")
             return result
@@ -89,6 +79,77 @@ class LLMClient:
             logger.error(f"LLM analysis failed for {file_path}: {e}")
             return self._fallback_analysis(file_path, symbols)
     
+    def analyze_components_batch(self, components: List[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Analyze several (file_path, file_content, symbols) components with one LLM request, in input order."""
+        if not self.client or len(components) < 2:
+            return [self.analyze_component(*component) for component in components]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(components)
+        cache_files = []
+        pending = []
+        for index, (file_path, file_content, symbols) in enumerate(components):
+            cache_key = self._generate_cache_key(file_path, file_content, symbols)
+            cache_file = self.cache_dir / f"{cache_key}.json"
+            cache_files.append(cache_file)
+            results[index] = self._load_cached_result(cache_file, file_path)
+            if results[index] is None:
+                pending.append(index)
+        
+        if not pending:
+            return results
+        
+        # The system prompt is shared with single-file requests so the provider can
+        # reuse its cached prefix
+        prompt = self._create_batch_analysis_prompt([components[index] for index in pending])
+        batch_results = None
+        try:
+            response = self.client.chat.completions.create(
+                model=settings.OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": self._get_system_prompt()},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=min(settings.LLM_MAX_TOKENS * len(pending), settings.LLM_MAX_OUTPUT_TOKENS),
+                temperature=settings.LLM_TEMPERATURE
+            )
+            batch_results = self._parse_batch_llm_response(response.choices[0].message.content, len(pending))
+        except Exception as e:
+            logger.warning(f"Batch LLM analysis failed for {len(pending)} components: {e}")
+        
+        if batch_results is None:
+            # Fall back to one request per component
+            for index in pending:
+                results[index] = self.analyze_component(*components[index])
+            return results
+        
+        for index, result in zip(pending, batch_results):
+            self._store_cached_result(cache_files[index], result)
+            results[index] = result
+        
+        logger.debug(f"Batch LLM analysis completed for {len(pending)} components")
+        return results
+    
+    def _load_cached_result(self, cache_file: Path, file_path: str) -> Optional[Dict[str, Any]]:
+        """Load a cached analysis result, or None when caching is off or there is no usable entry."""
+        if settings.LLM_CACHE_ENABLED and cache_file.exists():
+            try:
+                with open(cache_file, 'r') as f:
+                    cached_result = json.load(f)
+                logger.debug(f"Using cached LLM analysis for {file_path}")
+                return cached_result
+            except Exception as e:
+                logger.warning(f"Failed to load cached result: {e}")
+        return None
+    
+    def _store_cached_result(self, cache_file: Path, result: Dict[str, Any]) -> None:
+        """Write an analysis result to the cache when caching is enabled."""
+        if settings.LLM_CACHE_ENABLED:
+            try:
+                with open(cache_file, 'w') as f:
+                    json.dump(result, f, indent=2)
+            except Exception as e:
+                logger.warning(f"Failed to cache result: {e}")
+    
     def _get_system_prompt(self) -> str:
         """Get the system prompt for LLM analysis."""
         return """You are an expert software architect analyzing code components for a hierarchical graph representation.
@@ -135,6 +196,33 @@ Provide a JSON analysis of this component's role in the system architecture."""
         
         return prompt
     
+    def _create_batch_analysis_prompt(self, components: List[Tuple[str, str, Dict[str, Any]]]) -> str:
+        """Create a prompt asking for the analysis of several code components at once."""
+        sections = [
+            f"### Component {number}\n{self._create_analysis_prompt(file_path, file_content, symbols)}"
+            for number, (file_path, file_content, symbols) in enumerate(components, 1)
+        ]
+        return (
+            f"Analyze the following {len(components)} code components.\n\n"
+            + "\n\n".join(sections)
+            + f"\n\nRespond with a JSON array of exactly {len(components)} analysis objects, "
+            "one per component and in the same order."
+        )
+    
+    def _parse_batch_llm_response(self, response: str, count: int) -> Optional[List[Dict[str, Any]]]:
+        """Parse a batch LLM response into normalized results, or None when it does not match the batch."""
+        start = response.find('[')
+        end = response.rfind(']') + 1
+        if start < 0 or end <= start:
+            return None
+        try:
+            items = json.loads(response[start:end])
+        except ValueError:
+            return None
+        if not isinstance(items, list) or len(items) != count or not all(isinstance(item, dict) for item in items):
+            return None
+        return [self._normalize_result(item) for item in items]
+    
     def _parse_llm_response(self, response: str) -> Dict[str, Any]:
         """Parse the LLM response into a structured format."""
         try:
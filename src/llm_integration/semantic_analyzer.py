@@ -3,7 +3,7 @@ Semantic analyzer for AutoGraph.
 Prepares LLM prompts and handles semantic analysis of code components.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from ..utils.logger import get_logger
 from ..models.schemas import NodeLevel, NodeType, ComplexityLevel
@@ -47,6 +47,31 @@ class SemanticAnalyzer:
         
         return semantic_analysis
     
+    def analyze_files_semantics_batch(self, files: List[Tuple[str, Dict[str, List[SymbolInfo]], str]]) -> Dict[str, Dict[str, Any]]:
+        """Analyze several (file_path, symbols, file_content) items, sending uncached files to the LLM together."""
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = []
+        for file_path, symbols, file_content in files:
+            cache_key = self._generate_cache_key(file_path, symbols)
+            if cache_key in self.cache:
+                logger.debug(f"Using cached analysis for: {file_path}")
+                results[file_path] = self.cache[cache_key]
+            else:
+                pending.append((file_path, symbols, file_content, cache_key))
+        
+        llm_results = self.llm_client.analyze_components_batch([
+            (file_path, file_content, self._convert_symbols_to_serializable(symbols))
+            for file_path, symbols, file_content, _ in pending
+        ])
+        
+        for (file_path, symbols, _, cache_key), llm_result in zip(pending, llm_results):
+            semantic_analysis = self._convert_llm_result(llm_result, file_path, symbols)
+            self.cache[cache_key] = semantic_analysis
+            self.analysis_results[file_path] = semantic_analysis
+            results[file_path] = semantic_analysis
+        
+        return results
+    
     def _generate_semantic_analysis(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate semantic analysis based on file characteristics."""
         file_name = analysis_data['file_name'].lower()
@@ -300,13 +325,10 @@ class SemanticAnalyzer:
     
     def _generate_cache_key(self, file_path: str, symbols: Dict[str, List[SymbolInfo]]) -> str:
         """Generate a cache key for the analysis."""
-        import hashlib
-        
-        # Create a hash based on file path and symbol counts
+        # Key on file path and symbol counts; the cache is an in-memory dict that
+        # already hashes its keys, so no digest is needed
         symbol_summary = f"{len(symbols.get('functions', []))}_{len(symbols.get('classes', []))}_{len(symbols.get('imports', []))}"
-        content = f"{file_path}_{symbol_summary}"
-        
-        return hashlib.md5(content.encode()).hexdigest()
+        return f"{file_path}_{symbol_summary}"
     
     def prepare_llm_prompt(self, file_path: str, symbols: Dict[str, List[SymbolInfo]], 
                           file_content: str) -> str:
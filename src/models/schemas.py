@@ -3,7 +3,7 @@ Pydantic schemas for AutoGraph data structures.
 Defines the structure for nodes, edges, and metadata in the hierarchical graph.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from enum import Enum
 from pydantic import BaseModel, Field
 from datetime import datetime
@@ -124,7 +124,7 @@ class GraphNode(BaseModel):
     level: NodeLevel = Field(..., description="Level in the hierarchy (BUSINESS/SYSTEM/IMPLEMENTATION)")
     
     # File information
-    files: List[str] = Field(default_factory=list, description="List of file paths")
+    files: Tuple[str, ...] = Field(default_factory=tuple, description="File paths")
     line_numbers: Dict[str, List[int]] = Field(default_factory=dict, description="Line numbers by file")
     
     # Relationships
@@ -132,8 +132,8 @@ class GraphNode(BaseModel):
     children: List[str] = Field(default_factory=list, description="Child node IDs")
     
     # Content
-    functions: List[str] = Field(default_factory=list, description="List of function names")
-    classes: List[str] = Field(default_factory=list, description="List of class names")
+    functions: Tuple[str, ...] = Field(default_factory=tuple, description="Function names")
+    classes: Tuple[str, ...] = Field(default_factory=tuple, description="Class names")
     imports: List[str] = Field(default_factory=list, description="List of imports")
     
     # Metadata
@@ -23,22 +23,24 @@ class PythonASTParser:
         self.variables: List[SymbolInfo] = []
         self.errors: List[str] = []
     
-    def parse_file(self, file_path: Path) -> bool:
-        """Parse a Python file and extract symbols."""
+    def parse_file(self, file_path: Path, content: Optional[str] = None) -> bool:
+        """Parse a Python file and extract symbols, reading it only if `content` is not given."""
         try:
-            content = self._read_file(file_path)
+            if content is None:
+                content = self._read_file(file_path)
             if content is None:
                 return False
             
             # Parse with ast_comments to handle comments
             tree = ast_comments.parse(content)
             
-            # Reset state
-            self.imports.clear()
-            self.functions.clear()
-            self.classes.clear()
-            self.variables.clear()
-            self.errors.clear()
+            # Reset state with fresh lists; clearing in place would empty the lists
+            # already handed out for the previously parsed file
+            self.imports = []
+            self.functions = []
+            self.classes = []
+            self.variables = []
+            self.errors = []
             
             # Visit all nodes
             visitor = PythonSymbolVisitor(file_path)
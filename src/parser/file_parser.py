@@ -3,7 +3,10 @@ Main file parser for AutoGraph.
 Coordinates parsing of different file types and manages the parsing pipeline.
 """
 
-from typing import Dict, List, Optional, Any
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from ..utils.logger import get_logger
 from ..utils.file_utils import FileUtils
@@ -12,6 +15,22 @@ from .ast_parser import PythonASTParser
 
 logger = get_logger(__name__)
 
+# Below this many files the process pool start-up costs more than it saves
+PARALLEL_PARSE_MIN_FILES = 64
+
+# Per-process parser used by parallel parse workers, built on first use in each worker
+_WORKER_PARSER: Optional['FileParser'] = None
+
+
+def _parse_file_worker(item: Tuple[Path, str]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Read and parse a single (file_path, codebase_path) item in a worker process."""
+    global _WORKER_PARSER
+    if _WORKER_PARSER is None:
+        _WORKER_PARSER = FileParser()
+    file_path, codebase_path = item
+    content = FileUtils.read_many([file_path]).get(file_path)
+    return _WORKER_PARSER._parse_file_entry(file_path, codebase_path, content)
+
 
 class FileParser:
     """Main file parser that handles different file types."""
@@ -23,8 +42,8 @@ class FileParser:
         self.total_files = 0
         self.successful_parses = 0
     
-    def parse_codebase(self, codebase_path: str) -> Dict[str, Any]:
-        """Parse all files in a codebase."""
+    def parse_codebase(self, codebase_path: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Parse all files in a codebase, across processes when there are many files and CPUs."""
         logger.info(f"Starting codebase parsing: {codebase_path}")
         
         # Discover files
@@ -35,59 +54,91 @@ class FileParser:
             logger.error(f"Failed to discover files: {e}")
             return self._create_error_result(str(e))
         
-        # Parse each file
-        for file_path in files:
-            self._parse_single_file(file_path, codebase_path)
+        workers = max_workers or os.cpu_count() or 1
+        if workers > 1 and len(files) >= PARALLEL_PARSE_MIN_FILES:
+            try:
+                results = self._parse_files_parallel(files, codebase_path, workers)
+            except BrokenProcessPool as e:
+                logger.warning(f"Parallel parsing failed ({e}); parsing serially")
+                self._parse_files_serial(files, codebase_path)
+            else:
+                for file_path, (file_data, error) in zip(files, results):
+                    self._record_parse_result(file_path, file_data, error)
+        else:
+            self._parse_files_serial(files, codebase_path)
         
         # Generate results
         return self._create_parsing_result(codebase_path)
     
-    def _parse_single_file(self, file_path: Path, codebase_path: str) -> None:
+    def _parse_files_parallel(self, files: List[Path], codebase_path: str,
+                              max_workers: int) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """Parse files across worker processes, returning (file_data, error) in discovery order."""
+        # Workers read and parse their own files; map() keeps discovery order
+        items = [(file_path, codebase_path) for file_path in files]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_parse_file_worker, items, chunksize=32))
+    
+    def _parse_files_serial(self, files: List[Path], codebase_path: str) -> None:
+        """Parse files one by one in this process."""
+        # Read every file once; the content is shared by line counting, AST parsing
+        # and the stored file content
+        contents = FileUtils.read_many(files)
+        
+        for file_path in files:
+            self._parse_single_file(file_path, codebase_path, contents.get(file_path))
+    
+    def _parse_single_file(self, file_path: Path, codebase_path: str, content: Optional[str] = None) -> None:
         """Parse a single file based on its type."""
+        file_data, error = self._parse_file_entry(file_path, codebase_path, content)
+        self._record_parse_result(file_path, file_data, error)
+    
+    def _parse_file_entry(self, file_path: Path, codebase_path: str,
+                          content: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Parse a single file, returning its parsed data or an error message."""
         try:
-            file_info = FileUtils.get_file_info(file_path)
+            file_info = FileUtils.get_file_info(file_path, content)
             relative_path = FileUtils.get_relative_path(file_path, Path(codebase_path))
             
             logger.debug(f"Parsing file: {relative_path}")
             
             # Parse based on file type
             if file_path.suffix.lower() == '.py':
-                success = self._parse_python_file(file_path, file_info)
+                file_data = self._parse_python_file(file_path, file_info, content)
             else:
                 # For non-Python files, just collect basic info
-                success = self._parse_generic_file(file_path, file_info)
+                file_data = self._parse_generic_file(file_path, file_info, content)
             
-            if success:
-                self.successful_parses += 1
-                logger.log_file_processed(str(file_path), True)
-            else:
-                self.failed_files.append(str(file_path))
-                logger.log_file_processed(str(file_path), False, "Parsing failed")
+            return file_data, None if file_data is not None else "Parsing failed"
                 
         except Exception as e:
             error_msg = f"Error processing {file_path}: {e}"
             logger.error(error_msg)
+            return None, error_msg
+    
+    def _record_parse_result(self, file_path: Path, file_data: Optional[Dict[str, Any]],
+                             error: Optional[str]) -> None:
+        """Store a parsed file or record it as failed."""
+        if file_data is not None:
+            self.parsed_files[str(file_path)] = file_data
+            self.successful_parses += 1
+            logger.log_file_processed(str(file_path), True)
+        else:
             self.failed_files.append(str(file_path))
-            logger.log_file_processed(str(file_path), False, error_msg)
+            logger.log_file_processed(str(file_path), False, error)
     
-    def _parse_python_file(self, file_path: Path, file_info: FileInfo) -> bool:
+    def _parse_python_file(self, file_path: Path, file_info: FileInfo, content: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Parse a Python file using AST parser."""
         try:
-            success = self.python_parser.parse_file(file_path)
+            success = self.python_parser.parse_file(file_path, content)
             
             if success:
-                # Read file content for LLM analysis
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        file_content = f.read()
-                except Exception as e:
-                    logger.warning(f"Could not read file content for {file_path}: {e}")
-                    file_content = ""
+                # Keep file content for LLM analysis
+                file_content = content if content is not None else self._read_content(file_path)
                 
                 # Collect parsing results
                 symbols = self.python_parser.get_symbols()
                 
-                self.parsed_files[str(file_path)] = {
+                return {
                     'file_info': file_info,
                     'symbols': symbols,
                     'file_content': file_content,
@@ -96,28 +147,21 @@ class FileParser:
                     'classes': [c.name for c in self.python_parser.get_classes()],
                     'errors': self.python_parser.get_errors()
                 }
-                
-                return True
             else:
-                return False
+                return None
                 
         except Exception as e:
             logger.log_parsing_error(str(file_path), str(e))
-            return False
+            return None
     
-    def _parse_generic_file(self, file_path: Path, file_info: FileInfo) -> bool:
+    def _parse_generic_file(self, file_path: Path, file_info: FileInfo, content: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Parse a non-Python file (basic info only)."""
         try:
-            # Read file content for LLM analysis
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-            except Exception as e:
-                logger.warning(f"Could not read file content for {file_path}: {e}")
-                file_content = ""
+            # Keep file content for LLM analysis
+            file_content = content if content is not None else self._read_content(file_path)
             
             # For non-Python files, we just collect basic metadata
-            self.parsed_files[str(file_path)] = {
+            return {
                 'file_info': file_info,
                 'symbols': {
                     'imports': [],
@@ -132,11 +176,18 @@ class FileParser:
                 'errors': []
             }
             
-            return True
-            
         except Exception as e:
             logger.error(f"Error parsing generic file {file_path}: {e}")
-            return False
+            return None
+    
+    def _read_content(self, file_path: Path) -> str:
+        """Read file content for LLM analysis, returning an empty string on failure."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except Exception as e:
+            logger.warning(f"Could not read file content for {file_path}: {e}")
+            return ""
     
     def _create_parsing_result(self, codebase_path: str) -> Dict[str, Any]:
         """Create the final parsing result."""
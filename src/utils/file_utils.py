@@ -79,18 +79,21 @@ class FileUtils:
         return files
     
     @staticmethod
-    def get_file_info(file_path: Path) -> FileInfo:
-        """Extract metadata from a file."""
+    def get_file_info(file_path: Path, content: Optional[str] = None) -> FileInfo:
+        """Extract metadata from a file, counting lines from `content` when already read."""
         try:
             stat_info = file_path.stat()
             
             # Count lines
             line_count = 0
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    line_count = sum(1 for _ in f)
-            except Exception as e:
-                logger.warning(f"Could not count lines in {file_path}: {e}")
+            if content is not None:
+                line_count = content.count('\n') + (1 if content and not content.endswith('\n') else 0)
+            else:
+                try:
+                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                        line_count = sum(1 for _ in f)
+                except Exception as e:
+                    logger.warning(f"Could not count lines in {file_path}: {e}")
             
             # Get language and category
             language = FileCategorizer.get_language(str(file_path))
@@ -128,6 +131,48 @@ class FileUtils:
             logger.error(f"Error reading file {file_path}: {e}")
             return None
     
+    # Files at or below this size are read with a single raw read() call
+    SMALL_FILE_THRESHOLD = 64 * 1024
+    
+    @staticmethod
+    def read_many(file_paths: List[Path]) -> Dict[Path, Optional[str]]:
+        """Read the content of many files up front so each file is read only once."""
+        contents = {}
+        for file_path in file_paths:
+            content = None
+            try:
+                if file_path.stat().st_size <= FileUtils.SMALL_FILE_THRESHOLD:
+                    content = FileUtils._read_small_file(file_path)
+            except OSError:
+                pass
+            if content is None:
+                content = FileUtils.get_file_content(file_path)
+            contents[file_path] = content
+        return contents
+    
+    @staticmethod
+    def _read_small_file(file_path: Path) -> Optional[str]:
+        """Read a small file with one unbuffered read, decoding like text-mode open()."""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            data = os.read(fd, FileUtils.SMALL_FILE_THRESHOLD + 1)
+        finally:
+            os.close(fd)
+        
+        # The file grew past the threshold since stat(); let the buffered path handle it
+        if len(data) > FileUtils.SMALL_FILE_THRESHOLD:
+            return None
+        
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            text = data.decode('utf-8', errors='ignore')
+        
+        # Apply universal newline translation as text-mode reads do
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
     @staticmethod
     def get_relative_path(file_path: Path, base_path: Path) -> str:
         """Get relative path from base path."""